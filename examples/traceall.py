@@ -1,64 +1,170 @@
 #!/usr/bin/python3
-"""Pulls trace data for all aircraft and outputs to files in ./traceall_out"""
+"""Pulls trace data for all aircraft and streams it into compressed shards in ./traceall_out
 
-from adsblookup import bincraft, classes, adsb_trace
-from adsblookup.classes import *
+Each shard holds one raw trace JSON per line (load one with AdsbTrace(json.loads(line))), compressed with zstd when
+the zstandard module is installed and gzip otherwise. Shards are rotated once they reach a size, and the hexes whose
+traces are safely written are recorded in a checkpoint, so an interrupted run resumes where it stopped."""
 
-from tqdm import tqdm
-import pandas as pd
-import threading
 import os
+import sys
+
+# The adsblookup modules import each other by flat name, so their directory goes on the path instead of the package
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src", "adsblookup"))
+
+import bincraft, project
+
+from tqdm import tqdm
+import argparse
 import concurrent.futures
-import re
-import types
+import gzip
+import io
 import json
+import re
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+checkpoint_name = "completed.txt"
+
+
+class ShardWriter:
+    """Writes lines into compressed shard files, starting a new shard once one reaches max_bytes"""
+
+    def __init__(self, folder: str, max_bytes: int = 256 * 2 ** 20) -> None:
+        self.folder = folder
+        self.max_bytes = max_bytes
+        self.extension = ".ndjson.zst" if zstandard is not None else ".ndjson.gz"
+        # Shards of earlier runs are left alone, their last frame may be incomplete
+        self.index = len([name for name in os.listdir(folder) if name.startswith("traces-")])
+        self.file = None
+        self.stream = None
+
+    def write(self, line: str) -> None:
+        if self.stream is None:
+            self.__open()
+        self.stream.write(line.encode() + b"\n")
+
+    def flush(self) -> None:
+        """Completes the compressed frame, so everything written so far can be read back even if the run dies"""
+        if self.stream is None:
+            return
+        if zstandard is not None:
+            self.stream.flush(zstandard.FLUSH_FRAME)
+        else:
+            self.stream.flush()
+        self.file.flush()
+        if self.file.tell() >= self.max_bytes:
+            self.close()
+
+    def close(self) -> None:
+        if self.stream is None:
+            return
+        self.stream.close()
+        self.file.close()
+        self.stream = self.file = None
+
+    def __open(self) -> None:
+        self.file = open(os.path.join(self.folder, f"traces-{self.index:05d}{self.extension}"), "wb")
+        self.index += 1
+        if zstandard is not None:
+            self.stream = zstandard.ZstdCompressor(level=3).stream_writer(self.file, closefd=False)
+        else:
+            self.stream = gzip.GzipFile(fileobj=self.file, mode="wb")
+
+
+def read_traces(folder: str = "traceall_out"):
+    """Yields the raw traces of every shard, stopping quietly at a shard's incomplete tail"""
+    for name in sorted(os.listdir(folder)):
+        if not name.startswith("traces-"):
+            continue
+        with open(os.path.join(folder, name), "rb") as file:
+            if name.endswith(".zst"):
+                stream = io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(file, read_across_frames=True))
+            else:
+                stream = gzip.GzipFile(fileobj=file, mode="rb")
+            try:
+                for line in stream:
+                    if line.endswith(b"\n"):
+                        yield json.loads(line)
+            except (EOFError, zstandard.ZstdError if zstandard is not None else EOFError):
+                pass
+
+
+def __pull_all(hexes: list, output_folder: str = "traceall_out", workers: int = 10, in_flight: int = 40,
+               flush_every: int = 100, max_bytes: int = 256 * 2 ** 20, recent: bool = False):
+    """Pull traces for every hex with multithread, skipping the hexes completed by earlier runs."""
+    os.makedirs(output_folder, exist_ok=True)
+    checkpoint_path = os.path.join(output_folder, checkpoint_name)
+    completed = set()
+    if os.path.exists(checkpoint_path):
+        with open(checkpoint_path) as f:
+            completed = {line.strip() for line in f if line.strip()}
+    hexes = [hex for hex in dict.fromkeys(hexes) if hex not in completed]
+
+    shards = ShardWriter(output_folder, max_bytes)
+    checkpoint = open(checkpoint_path, "a")
+    unrecorded = []
+
+    def record():
+        """Checkpoints the hexes whose traces were written, once the shard holding them is flushed"""
+        shards.flush()
+        checkpoint.write("".join(hex + "\n" for hex in unrecorded))
+        checkpoint.flush()
+        unrecorded.clear()
 
-def __pull_all(hexes:list):
-    """Pull traces for every hex with multithread."""
-    output_folder = "traceall_out"
-    def pull(hex:str):
-        """Pull a single aircraft trace"""
-        trace = adsb_trace.pull_trace(hex)
-        return trace
-    
     def write(future):
-        """Callback function to write trace data to file"""
-        result = future.result()
+        hex, result = future.result()
         pbar.update(1)
-        if result == None:
+        # Failed pulls are not checkpointed, so a resumed run retries them
+        if result is None:
             return
-        icao = result.icao
-        path = os.path.join(output_folder, icao)
-        with open (path, 'wt') as f:
-            f.write(json.dumps(result,indent=4))    
-
-    # Create the output folder
-    if not os.path.exists(output_folder):
-        os.mkdir(output_folder)
-
-    pbar = None
-    with tqdm(total=len(hexes)) as _pbar:
-        pbar = _pbar
-        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-            for i in range(len(hexes)):
-                # Queue the trace pull for multithread execution
-                future:concurrent.futures.Future = executor.submit(pull, hex=hexes[i])
-                # Note: use callback function to prevent memory leak from holding reference to futures
-                future.add_done_callback(write)
-
-def pull_all():
-    snapshot = bincraft.pull_snapshot()
-    
+        shards.write(json.dumps(result, separators=(",", ":")))
+        unrecorded.append(hex)
+        if len(unrecorded) >= flush_every:
+            record()
+
+    def pull(hex: str):
+        """Pull a single aircraft trace"""
+        return hex, project.pull_trace_raw(hex, recent=recent)
+
+    with tqdm(total=len(hexes)) as pbar:
+        try:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+                # At most in_flight traces are pending, so memory stays flat however many hexes there are
+                pending = set()
+                for hex in hexes:
+                    if len(pending) >= in_flight:
+                        done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                        for future in done:
+                            write(future)
+                    pending.add(executor.submit(pull, hex))
+                for future in concurrent.futures.as_completed(pending):
+                    write(future)
+        finally:
+            record()
+            shards.close()
+            checkpoint.close()
+
+
+def pull_all(**kwargs):
+    snapshot = bincraft.pull_snapshot(columnar=True)
+
     # Get all ICAO hexes
-    hexes = []
-    for ac in snapshot.aircraft:
-        ac:AdsbAircraft
-        hex = ac.hex
-        hex = re.sub('[^A-Za-z0-9]+', '', hex)
-        hexes.append(hex)
-    
+    hexes = [re.sub('[^A-Za-z0-9]+', '', hex) for hex in snapshot.aircraft.columns["hex"].tolist()]
+
     #get trace of all aircraft
-    __pull_all(hexes)
-    
-if __name__=="__main__":
-    pull_all()
\ No newline at end of file
+    __pull_all(hexes, **kwargs)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--out", dest="output_folder", default="traceall_out", help="output folder")
+    parser.add_argument("--workers", type=int, default=10, help="concurrent trace requests")
+    parser.add_argument("--in-flight", type=int, default=40, help="maximum traces pending at once")
+    parser.add_argument("--shard-mb", type=int, default=256, help="compressed size at which shards rotate")
+    parser.add_argument("--recent", action="store_true", help="pull only the last 1-2 hours of each trace")
+    args = parser.parse_args()
+    pull_all(output_folder=args.output_folder, workers=args.workers, in_flight=args.in_flight,
+             max_bytes=args.shard_mb * 2 ** 20, recent=args.recent)
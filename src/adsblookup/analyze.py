@@ -4,12 +4,9 @@ import matplotlib.pyplot as plt
 from sklearn import tree
 import math
 
-file = open("frames.csv")
-frames = file.read()
-file.close()
-frames = [np.array([float(col) for col in row.split(",") if len(col) > 0]) for row in frames.strip().split("\n")]
-frames = [frame for frame in frames if frame[2] < 20000]
-x = np.array(frames)
+from framestore import FrameStore
+
+x = FrameStore().features(max_alt=20000)
 forest = IForest(max_samples=len(x))
 forest.fit(x)
 print(forest.feature_importances_)
@@ -0,0 +1,87 @@
+"""basemap.py caches the Natural Earth layers drawn under the flight maps.
+A layer is downloaded and parsed once, clipped to the map's extent, and stored in the cache directory as GeoParquet
+(pickled when pyarrow is missing) at several levels of simplification, so later startups read a small local file
+and work offline."""
+
+from utils import cache_path
+import hashlib
+import os
+import pickle
+import geopandas as gpd
+
+version = 1
+"Bumped whenever the cached layout changes"
+
+levels = (0.0, 0.005, 0.02, 0.1)
+"""Simplification tolerances in degrees of the cached copies, 0 keeps the full resolution"""
+
+states_url = "https://naciscdn.org/naturalearth/10m/cultural/ne_10m_admin_1_states_provinces.zip"
+countries_url = "https://naciscdn.org/naturalearth/110m/cultural/ne_110m_admin_0_countries.zip"
+
+
+def level_for(extent: tuple, pixels: int = 800) -> float:
+    """Picks the coarsest tolerance that stays below a pixel when the extent is drawn.
+    @extent: The drawn (lat_min, lat_max, lon_min, lon_max).
+    @pixels: Width of the drawing in pixels.
+    """
+    resolution = (extent[3] - extent[2]) / pixels
+    return max(tolerance for tolerance in levels if tolerance <= resolution)
+
+
+def load(url: str, extent: tuple = None, where: dict = None, tolerance: float = 0.0) -> gpd.GeoDataFrame:
+    """Loads a layer, from the local cache when it was loaded before.
+    @url: The source of the layer, anything gpd.read_file accepts.
+    @extent: (lat_min, lat_max, lon_min, lon_max) the layer is clipped to, or None for all of it.
+    @where: Column values the kept rows must have, e.g. {"admin": "United States of America"}.
+    @tolerance: Simplification tolerance, rounded down to the nearest of levels.
+    """
+    tolerance = max(level for level in levels if level <= tolerance)
+    key = repr((version, url, extent, sorted((where or {}).items())))
+    base = cache_path(f"basemap-{hashlib.sha256(key.encode()).hexdigest()[:16]}")
+
+    frame = __read(f"{base}-{tolerance}")
+    if frame is not None:
+        return frame
+
+    frame = gpd.read_file(url)
+    for column, value in (where or {}).items():
+        frame = frame[frame[column] == value]
+    if extent is not None:
+        frame = frame.clip([extent[2], extent[0], extent[3], extent[1]])
+    frame = frame[~frame.geometry.is_empty]
+
+    # Every level is stored at once, so zooming never needs the source again
+    loaded = None
+    for level in levels:
+        simplified = frame if level == 0 else frame.assign(geometry=frame.geometry.simplify(level, preserve_topology=True))
+        __write(simplified, f"{base}-{level}")
+        if level == tolerance:
+            loaded = simplified
+    return loaded
+
+
+def __read(base: str):
+    """Reads a cached layer, or returns None when it is missing or unreadable"""
+    if os.path.exists(base + ".parquet"):
+        try:
+            return gpd.read_parquet(base + ".parquet")
+        except (ImportError, OSError, ValueError):
+            pass
+    if os.path.exists(base + ".pickle"):
+        try:
+            with open(base + ".pickle", "rb") as file:
+                return pickle.load(file)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, AttributeError, ImportError):
+            pass
+    return None
+
+
+def __write(frame: gpd.GeoDataFrame, base: str) -> None:
+    """Writes a layer to the cache, as GeoParquet when pyarrow is available"""
+    try:
+        frame.to_parquet(base + ".parquet.tmp")
+        os.replace(base + ".parquet.tmp", base + ".parquet")
+    except ImportError:
+        with open(base + ".pickle.tmp", "wb") as file:
+            pickle.dump(frame, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(base + ".pickle.tmp", base + ".pickle")
@@ -0,0 +1,330 @@
+#!/usr/bin/python3
+"""benchmark.py times the stages of the snapshot pipeline on identical data.
+Run as a script to print the results, and save them as JSON with --json to compare commits with --compare.
+Captures recorded with capture.py or compressed bincraft frames can be passed as files, otherwise seeded synthetic
+frames around one airport, over the US and over the globe are generated (compressing them requires the zstandard module)."""
+
+from bincraft import *
+from scoring import RegionScorer, snapshot_features
+from diff import diff
+from tracks import TrackStore
+from utils import bounding_box, pull_airport
+import bincraft
+import capture
+import json
+import os
+import platform
+import struct
+import subprocess
+import sys
+import time
+import tracemalloc
+
+fixtures = {
+    "airport": (60, bounding_box(38.8058, -104.701, 25)),
+    "us": (6000, (24.0, 50.0, -125.0, -66.0)),
+    "globe": (12000, world),
+}
+"""Synthetic workloads as the number of aircraft in the frame and the box it is pulled for"""
+
+regions = ["KCOS", "KDEN", "KORD", "KATL", "KLAX", "KJFK", "EGLL", "EDDF", "RJTT", "YSSY"]
+"""Airports scored by the pipeline benchmark"""
+
+
+def percentiles(times: list) -> DotDict:
+    """Summarizes durations as the minimum, median, 90th and 99th percentile and maximum"""
+    times = sorted(times)
+
+    def at(q):
+        return times[min(int(q * len(times)), len(times) - 1)]
+
+    return DotDict(min=times[0], p50=at(0.5), p90=at(0.9), p99=at(0.99), max=times[-1])
+
+
+def timed(func, *args, repeat: int = 20) -> DotDict:
+    """Times repeated calls of a function.
+    Returns the percentiles in seconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        times.append(time.perf_counter() - start)
+    return percentiles(times)
+
+
+def synthetic_frame(count: int, box: tuple = world, stride: int = 112, seed: int = 0) -> bytes:
+    """Builds an uncompressed bincraft frame of random aircraft.
+    @count: Number of aircraft.
+    @box: Bounding box the positions are drawn from.
+    @stride: Size of an aircraft record in bytes.
+    @seed: Seed of the random generator, the same seed gives the same frame.
+    """
+    rng = np.random.default_rng(seed)
+    header = bytearray(stride)
+    struct.pack_into("IIIIIhhhhII", header, 0, int(time.time() * 1e3) % 2 ** 32, 0, stride, count, 0,
+                     int(box[0]), int(box[2]), int(box[1]), int(box[3]), count * 10, 20230101)
+    records = rng.integers(0, 256, size=(count, stride), dtype=np.uint8)
+    records[:, 3] &= 1
+    # Plausible positions, speeds and altitudes
+    fields = (
+        (8, "<i4", rng.uniform(box[2], box[3], count) * 1e6),
+        (12, "<i4", rng.uniform(box[0], box[1], count) * 1e6),
+        (16, "<i2", rng.normal(0, 150, count)),
+        (20, "<i2", rng.uniform(0, 1600, count)),
+        (34, "<i2", rng.uniform(0, 5000, count)),
+    )
+    for offset, dtype, values in fields:
+        width = np.dtype(dtype).itemsize
+        records[:, offset:offset + width] = values.astype(dtype).view(np.uint8).reshape(count, width)
+    records[:, 33] %= 0x80
+    records[:, 64] = rng.choice([0, 0xA1, 0xA2, 0xA3, 0xA5], size=count)
+    # Null-terminated callsign, type and registration
+    for start, end in ((78, 86), (88, 92), (92, 104)):
+        records[:, start:end] = rng.integers(0x30, 0x5b, size=(count, end - start))
+        length = rng.integers(0, end - start + 1, size=count)
+        records[:, start:end][np.arange(end - start) >= length[:, None]] = 0
+    return bytes(header) + records.tobytes()
+
+
+def compress(frame: bytes) -> bytes:
+    """Compresses a frame the way adsbexchange.com serves it"""
+    import zstandard
+    return zstandard.ZstdCompressor(level=3, write_content_size=True).compress(frame)
+
+
+def bench_decompress(compressed: bytes, repeat: int = 20) -> DotDict:
+    """Compares decompressing a frame with the native zstandard module and with the WASM module.
+    The WASM path is timed cold (compiling or loading the module) and warm (reusing the instance and arena)."""
+
+    wasm = bincraft.__load_wasm
+    results = DotDict()
+    reference = None
+    native = ZstdDecoder(wasm)
+    if native.native is not None:
+        reference = native.decompress(compressed)
+        results.native = timed(native.decompress, compressed, repeat=repeat)
+
+    try:
+        for name, cache in (("wasm_compile", False), ("wasm_cached", True)):
+            start = time.perf_counter()
+            wasm_decoder = ZstdDecoder(wasm, native=False, cache=cache)
+            output = wasm_decoder.decompress(compressed)
+            results[name] = time.perf_counter() - start
+    except ImportError:
+        # wasmer only runs on some interpreters, the native timings still stand
+        return results
+    results.wasm = timed(wasm_decoder.decompress, compressed, repeat=repeat)
+    results.identical = reference is None or reference == output
+    return results
+
+
+def bench_import(module: str = "bincraft", repeat: int = 5) -> DotDict:
+    """Times importing a module in a fresh interpreter, less the interpreter's own startup"""
+    here = os.path.dirname(os.path.abspath(__file__))
+
+    def run(code):
+        subprocess.run([sys.executable, "-c", code], cwd=here, check=True)
+
+    startup = timed(run, "pass", repeat=repeat)
+    imported = timed(run, f"import {module}", repeat=repeat)
+    return DotDict(startup=startup.p50, module=module, seconds=imported.p50 - startup.p50)
+
+
+def bench_attributes(count: int = 100000, repeat: int = 5) -> DotDict:
+    """Compares the throughput of reading aircraft attributes by dot notation and by key.
+    Returns reads per second for stored values, stored falsy values and missing keys."""
+    aircraft = AdsbAircraft.from_columns({key: [0] for key in AdsbAircraft.fields}, 0)
+    aircraft.hex = "abc123"
+    keys = ("hex", "gs", "missing")
+
+    def dots():
+        for _ in range(count):
+            aircraft.hex; aircraft.gs; aircraft.missing
+
+    def items():
+        for _ in range(count):
+            aircraft.get("hex"); aircraft.get("gs"); aircraft.get("missing")
+
+    return DotDict(dots=len(keys) * count / timed(dots, repeat=repeat).p50,
+                   lookups=len(keys) * count / timed(items, repeat=repeat).p50)
+
+
+class MemorySource:
+    """Serves compressed frames from memory in place of the live source, one after the other"""
+
+    host = None
+
+    def __init__(self, frames: list) -> None:
+        self.frames = frames
+        self.served = 0
+
+    def snapshot(self, box: tuple) -> DotDict:
+        content = self.frames[self.served % len(self.frames)]
+        self.served += 1
+        return DotDict(status=200, content=content, headers={}, cached=False)
+
+
+def synthetic(count: int, box: tuple, seed: int = 0) -> list:
+    """Builds a workload of one compressed synthetic frame as [(compressed, box)]"""
+    return [(compress(synthetic_frame(count, box, seed=seed)), tuple(box))]
+
+
+def workload(filename: str) -> list:
+    """Reads the snapshots of a capture, or a single compressed bincraft frame pulled for the globe, as [(compressed, box)]"""
+    if not os.path.exists(filename + ".idx"):
+        with open(filename, "rb") as file:
+            return [(file.read(), world)]
+    with capture.Replay(filename) as replay:
+        return [(bytes(replay.content(row)), tuple(replay.index["box"][row].tolist())) for row in replay.snapshots]
+
+
+def bench_scorer(seed: int = 0) -> RegionScorer:
+    """Builds a RegionScorer over the airports of regions, sharing one IForest fitted on a synthetic frame"""
+    from models import fit
+    frame = bincraft.__snapshot(bincraft.__wqi_columns(synthetic_frame(20000, seed=seed + 1)), True)
+    x = snapshot_features(frame).X
+    model = fit(x[np.isfinite(x).all(axis=1)])
+    return RegionScorer([(ident, lat, lon, model) for ident, lat, lon in map(pull_airport, regions)])
+
+
+def __stage(func, inputs: list, counts: list, repeat: int) -> DotDict:
+    """Times a stage on every input, repeat times, and traces its peak memory on the largest input"""
+    times = []
+    for _ in range(repeat):
+        for args in inputs:
+            start = time.perf_counter()
+            func(*args)
+            times.append(time.perf_counter() - start)
+    result = percentiles(times)
+    result.aircraft = sum(counts) / len(counts)
+    result.aircraft_per_second = repeat * sum(counts) / sum(times) if sum(times) > 0 else None
+
+    # Tracing slows allocations down, so memory is measured apart from the timed calls
+    largest = inputs[max(range(len(counts)), key=counts.__getitem__)]
+    tracemalloc.start()
+    try:
+        func(*largest)
+        result.peak_bytes = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return result
+
+
+def bench_pipeline(snapshots: list, scorer: RegionScorer, repeat: int = 10, legacy: bool = True) -> DotDict:
+    """Times each stage of pull_snapshot and of the map's scoring on a workload.
+    @snapshots: The workload as [(compressed, box)], see synthetic and workload.
+    @scorer: Scores the aircraft, see bench_scorer.
+    @repeat: Number of times each snapshot goes through every stage.
+    @legacy: If True, also times the record by record decoder __wqi.
+    Returns per stage its latency percentiles in seconds, the mean aircraft it handles, the aircraft per second and
+    its peak traced memory in bytes. The tick stage does the work of SnapshotWorker.tick, pulling from a source serving
+    from memory, extracting features, updating the tracks and scoring, without the Qt signals.
+    """
+    compressed = [(content,) for content, box in snapshots]
+    data = [(bincraft.__decompress(content),) for content, box in snapshots]
+    parsed = [bincraft.__wqi_columns(d) for d, in data]
+    cut = [dict(p, aircraft=bincraft.__in_box(p["aircraft"], box)) for p, (content, box) in zip(parsed, snapshots)]
+    columnar = [bincraft.__snapshot(dict(p), True) for p in cut]
+    features = [snapshot_features(snapshot) for snapshot in columnar]
+
+    decoded = [len(p["aircraft"]["hex"]) for p in parsed]
+    boxed = [len(p["aircraft"]["hex"]) for p in cut]
+    scored = [len(f.X) for f in features]
+    source = MemorySource([content for content, box in snapshots])
+    boxes = [(box,) for content, box in snapshots]
+    tracks = TrackStore()
+
+    def tick(box):
+        snapshot = pull_snapshot(box, columnar=True, source=source)
+        features = snapshot_features(snapshot)
+        tracks.update(snapshot)
+        DotDict(features=features, result=scorer.score(features), tracks=tracks.features(features.hex))
+
+    stages = [
+        ("decompress", bincraft.__decompress, compressed, decoded),
+        ("wqi_columns", bincraft.__wqi_columns, data, decoded),
+        ("in_box", lambda p, box: bincraft.__in_box(p["aircraft"], box),
+         [(p, box) for p, (content, box) in zip(parsed, snapshots)], decoded),
+        ("snapshot", lambda p: bincraft.__snapshot(dict(p), False), [(p,) for p in cut], boxed),
+        ("columnar_snapshot", lambda p: bincraft.__snapshot(dict(p), True), [(p,) for p in cut], boxed),
+        ("features", snapshot_features, [(snapshot,) for snapshot in columnar], boxed),
+        # Each snapshot against the one before, the first one against itself
+        ("diff", diff, list(zip(columnar[:1] + columnar[:-1], columnar)), boxed),
+        ("score", scorer.score, [(f,) for f in features], scored),
+        ("tick", tick, boxes, boxed),
+    ]
+    if legacy:
+        stages.insert(1, ("wqi", bincraft.__wqi, data, decoded))
+    return DotDict((name, __stage(func, inputs, counts, repeat)) for name, func, inputs, counts in stages)
+
+
+def environment() -> DotDict:
+    """Describes what the results were measured on, including the commit of the working tree"""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        commit = None
+    return DotDict(commit=commit, time=time.time(), python=platform.python_version(), numpy=np.__version__,
+                   machine=platform.machine(), processor=platform.processor(), native_zstd=decoder().native is not None)
+
+
+def compare(baseline: dict, results: dict) -> list:
+    """Compares the median latencies of two runs saved as JSON.
+    Returns (workload, stage, baseline p50, p50, ratio) for every stage both runs measured.
+    """
+    rows = []
+    for name, stages in results["pipeline"].items():
+        for stage, result in stages.items():
+            before = baseline.get("pipeline", {}).get(name, {}).get(stage)
+            if before is not None and before["p50"] > 0:
+                rows.append((name, stage, before["p50"], result["p50"], result["p50"] / before["p50"]))
+    return rows
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Times the stages of the snapshot pipeline")
+    parser.add_argument("files", nargs="*", help="captures or compressed bincraft frames, synthetic frames by default")
+    parser.add_argument("--repeat", type=int, default=10, help="times every snapshot goes through each stage")
+    parser.add_argument("--json", help="file the results are saved to")
+    parser.add_argument("--compare", help="results of an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=1.1, help="slowdown reported as a regression")
+    args = parser.parse_args()
+
+    results = DotDict(environment=environment(), import_seconds=bench_import(), attributes=bench_attributes())
+    print("import:", results.import_seconds)
+    print("attribute reads per second:", results.attributes)
+
+    if args.files:
+        workloads = {name: workload(name) for name in args.files}
+    else:
+        workloads = {name: synthetic(count, box) for name, (count, box) in fixtures.items()}
+
+    results.decompress = DotDict()
+    for name, snapshots in workloads.items():
+        print(name, f"{len(snapshots)} snapshots, {sum(len(content) for content, box in snapshots)} bytes")
+        results.decompress[name] = bench_decompress(snapshots[0][0])
+        for stage, result in results.decompress[name].items():
+            print(f"  {stage}: {result}")
+
+    scorer = bench_scorer()
+    results.pipeline = DotDict()
+    for name, snapshots in workloads.items():
+        results.pipeline[name] = bench_pipeline(snapshots, scorer, args.repeat)
+        print(name)
+        for stage, result in results.pipeline[name].items():
+            rate = "-" if result.aircraft_per_second is None else f"{result.aircraft_per_second:,.0f}"
+            print(f"  {stage:18} p50 {result.p50 * 1e3:9.3f} ms  p99 {result.p99 * 1e3:9.3f} ms  "
+                  f"{rate:>14} aircraft/s  peak {result.peak_bytes / 2 ** 20:8.2f} MiB")
+
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(results, file, indent=4)
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+        print("compared to", baseline.get("environment", {}).get("commit"))
+        for name, stage, before, after, ratio in compare(baseline, results):
+            flag = "  REGRESSION" if ratio > args.threshold else ""
+            print(f"  {name}/{stage}: {before * 1e3:.3f} ms -> {after * 1e3:.3f} ms ({ratio:.2f}x){flag}")
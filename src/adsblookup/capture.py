@@ -0,0 +1,269 @@
+#!/usr/bin/python3
+"""capture.py records the raw responses of adsbexchange.com and replays them offline.
+A capture is an append-only data file holding every compressed bincraft snapshot and trace JSON exactly as it was
+received, next to an index of fixed-size entries with each record's kind, fetch time, box or aircraft, offset and length.
+A Recorder wraps a source and records what it serves; a Replay stands in for the live source of pull_snapshot,
+pull_trace and the Harvester, in real time or as fast as possible, so timing runs see identical traffic.
+Run as a script to record snapshots: capture.py traffic.cap --count 60 --interval 1 --box 36 42 -110 -100"""
+
+from classes import DotDict
+import fetch
+import mmap
+import os
+import threading
+import time
+import numpy as np
+
+snapshot, trace_full, trace_recent = 0, 1, 2
+"""Kinds of records"""
+
+index_dtype = np.dtype([
+    ("kind", "u1"),
+    ("time", "<f8"),
+    ("box", "<f8", (4,)),
+    ("icao", "S8"),
+    ("offset", "<u8"),
+    ("length", "<u4"),
+])
+"""Layout of an index entry. Time is the Unix epoch time of the fetch, box is NaN for traces and icao empty for snapshots.
+The data file repeats each entry in front of its payload, so a lost or truncated index is rebuilt from it"""
+
+
+def read_index(filename: str) -> np.ndarray:
+    """Reads the index of a capture, leaving out records that were not completely written"""
+    size = os.path.getsize(filename)
+    try:
+        with open(filename + ".idx", "rb") as file:
+            raw = file.read()
+        index = np.frombuffer(raw[:len(raw) - len(raw) % index_dtype.itemsize], dtype=index_dtype)
+    except FileNotFoundError:
+        index = np.empty(0, dtype=index_dtype)
+    index = index[index["offset"] + index["length"] <= size]
+    end = int(index["offset"][-1] + index["length"][-1]) if len(index) else 0
+    if end < size:
+        index = np.concatenate([index, __scan(filename, end, size)])
+    return index
+
+
+def __scan(filename: str, start: int, size: int) -> np.ndarray:
+    """Reads the entries in front of the payloads of a data file, stopping at an incomplete record"""
+    found = []
+    with open(filename, "rb") as file:
+        file.seek(start)
+        position = start
+        while position + index_dtype.itemsize <= size:
+            entry = np.frombuffer(file.read(index_dtype.itemsize), dtype=index_dtype)[0]
+            position += index_dtype.itemsize
+            if entry["offset"] != position or position + entry["length"] > size:
+                break
+            found.append(entry)
+            position += int(entry["length"])
+            file.seek(position)
+    return np.array(found, dtype=index_dtype)
+
+
+class Recorder:
+    """Records the snapshots and traces served by a source into a capture, and serves them on.
+    Recorders are thread safe, so one can be shared by the Harvester's workers."""
+
+    def __init__(self, filename: str, source=None) -> None:
+        """
+        @filename: The capture's data file, appended to if it exists. The index is kept next to it with a .idx suffix.
+        @source: The recorded source, fetch.live by default.
+        """
+        self.filename = filename
+        self.source = source if source is not None else fetch.live
+        self.__lock = threading.Lock()
+
+        # An interrupted recording leaves a partial record at the end, which is cut off before appending
+        index = read_index(filename) if os.path.exists(filename) else np.empty(0, dtype=index_dtype)
+        self.__size = int(index["offset"][-1] + index["length"][-1]) if len(index) else 0
+        if os.path.exists(filename):
+            os.truncate(filename, self.__size)
+        self.__data = open(filename, "ab")
+        with open(filename + ".idx", "wb") as file:
+            file.write(index.tobytes())
+        self.__index = open(filename + ".idx", "ab")
+        self.records = len(index)
+        "Number of records in the capture"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    @property
+    def host(self) -> str:
+        return self.source.host
+
+    def snapshot(self, box: tuple) -> DotDict:
+        """Gets a snapshot from the source, recording it unless the request failed"""
+        response = self.source.snapshot(box)
+        if response.status < 400:
+            self.write(snapshot, response.content, box=box)
+        return response
+
+    def trace(self, icao: str, recent: bool = False) -> DotDict:
+        """Gets a trace from the source, recording it unless the request failed"""
+        response = self.source.trace(icao, recent)
+        if response.status < 400:
+            self.write(trace_recent if recent else trace_full, response.content, icao=icao)
+        return response
+
+    def write(self, kind: int, content: bytes, box: tuple = None, icao: str = "", timestamp: float = None) -> None:
+        """Appends a record.
+        @kind: snapshot, trace_full or trace_recent.
+        @content: The response body as received.
+        @timestamp: Time of the fetch, now by default.
+        """
+        entry = np.zeros(1, dtype=index_dtype)
+        entry["kind"] = kind
+        entry["time"] = time.time() if timestamp is None else timestamp
+        entry["box"] = np.nan if box is None else box
+        entry["icao"] = icao.encode()
+        entry["length"] = len(content)
+        with self.__lock:
+            entry["offset"] = self.__size + index_dtype.itemsize
+            # The payload is written before its index entry, so an indexed record is always complete
+            self.__data.write(entry.tobytes() + content)
+            self.__data.flush()
+            self.__index.write(entry.tobytes())
+            self.__index.flush()
+            self.__size += index_dtype.itemsize + len(content)
+            self.records += 1
+
+    def close(self) -> None:
+        with self.__lock:
+            self.__data.close()
+            self.__index.close()
+
+
+class Replay:
+    """Serves the records of a capture in place of the live source.
+    Snapshots are served in recorded order whatever box is asked for, pull_snapshot still cuts them to the box.
+    Traces are served in recorded order per aircraft, the last one is repeated once they run out."""
+
+    host = None
+    "Replayed traffic is not sent anywhere, so it is not rate limited"
+
+    def __init__(self, filename: str, speed: float = None, loop: bool = False) -> None:
+        """
+        @filename: The capture's data file.
+        @speed: Factor on the recorded pace of snapshots, 1 replays in real time. None serves them as fast as possible.
+        @loop: If True, starts over once every snapshot was served instead of raising EOFError.
+        """
+        self.filename = filename
+        self.speed = speed
+        self.loop = loop
+        self.index = read_index(filename)
+        "Entries of the complete records"
+        self.__file = open(filename, "rb")
+        self.__map = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ) if len(self.index) else None
+        self.__lock = threading.Lock()
+
+        self.snapshots = np.flatnonzero(self.index["kind"] == snapshot)
+        "Rows of the snapshot records"
+        self.__traces = {}
+        for row in np.flatnonzero(self.index["kind"] != snapshot).tolist():
+            key = (self.index["icao"][row].decode(), bool(self.index["kind"][row] == trace_recent))
+            self.__traces.setdefault(key, []).append(row)
+        self.__served = {}
+        self.rewind()
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def rewind(self) -> None:
+        """Starts the replay over"""
+        with self.__lock:
+            self.cursor = 0
+            "Number of snapshots served since the start"
+            self.__start = None
+            self.__served = {}
+
+    def content(self, row: int) -> bytes:
+        """Reads the payload of a record"""
+        offset = int(self.index["offset"][row])
+        return self.__map[offset:offset + int(self.index["length"][row])]
+
+    def snapshot(self, box: tuple) -> DotDict:
+        """Serves the next snapshot, after waiting for its time when paced.
+        Raises EOFError once every snapshot was served, unless looping."""
+        with self.__lock:
+            if self.cursor == len(self.snapshots):
+                if not self.loop or len(self.snapshots) == 0:
+                    raise EOFError(f"Every snapshot of {self.filename} was served")
+                self.cursor = 0
+                self.__start = None
+            row = self.snapshots[self.cursor]
+            self.cursor += 1
+            recorded = float(self.index["time"][row])
+            if self.__start is None:
+                self.__start = (time.monotonic(), recorded)
+            due = self.__start[0] + (recorded - self.__start[1]) / self.speed if self.speed else 0
+        delay = due - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        return DotDict(status=200, content=self.content(row), headers={}, cached=False)
+
+    def trace(self, icao: str, recent: bool = False) -> DotDict:
+        """Serves the next recorded trace of an aircraft, a trace of the other kind if there is none, or a 404"""
+        icao = icao.lower()
+        key = (icao, recent) if (icao, recent) in self.__traces else (icao, not recent)
+        rows = self.__traces.get(key)
+        if rows is None:
+            return DotDict(status=404, content=b"", headers={}, cached=False)
+        with self.__lock:
+            served = self.__served.get(key, 0)
+            self.__served[key] = served + 1
+        return DotDict(status=200, content=self.content(rows[min(served, len(rows) - 1)]), headers={}, cached=False)
+
+    def close(self) -> None:
+        if self.__map is not None:
+            self.__map.close()
+        self.__file.close()
+
+
+def record(filename: str, box: tuple, count: int = None, interval: float = 1.0, source=None) -> int:
+    """Records snapshots of a box at a fixed interval.
+    @count: Number of snapshots to record, unlimited by default.
+    @interval: Time between the starts of two fetches in seconds.
+    @source: The recorded source, fetch.live by default.
+    Returns the number of snapshots recorded. Failed fetches are reported and skipped.
+    """
+    recorded = 0
+    with Recorder(filename, source) as recorder:
+        due = time.monotonic()
+        while count is None or recorded < count:
+            try:
+                response = recorder.snapshot(box)
+                recorded += response.status < 400
+                if response.status >= 400:
+                    print(f"Snapshot failed with status code {response.status}")
+            except Exception as e:
+                print(f"Snapshot failed: {e}")
+            due += interval
+            time.sleep(max(0.0, due - time.monotonic()))
+    return recorded
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Records adsbexchange.com snapshots into a capture file")
+    parser.add_argument("filename", help="capture data file, appended to if it exists")
+    parser.add_argument("--count", type=int, default=None, help="number of snapshots, unlimited by default")
+    parser.add_argument("--interval", type=float, default=1.0, help="seconds between snapshots")
+    parser.add_argument("--box", type=float, nargs=4, default=(-90, 90, -180, 180),
+                        metavar=("LAT_MIN", "LAT_MAX", "LON_MIN", "LON_MAX"), help="bounding box, the globe by default")
+    args = parser.parse_args()
+    try:
+        print(str(record(args.filename, tuple(args.box), args.count, args.interval)) + " snapshots recorded...")
+    except KeyboardInterrupt:
+        pass
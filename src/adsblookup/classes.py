@@ -1,30 +1,45 @@
 from typing import List
+from collections.abc import Sequence
+import reprlib
+import numpy as np
 
 class DotDict(dict):
-    """Wrapper for dict enabling dot notation access to dictionary attributes"""
+    """Wrapper for dict enabling dot notation access to dictionary attributes.
+    Names defined on the type, such as dict methods, resolve as usual; any other name reads the key, falsy values
+    included. Missing keys read as None, except for dunder names, which raise AttributeError as usual."""
 
     def __getattr__(self, name) -> any:
-        a = self.get(name)
-        if a is not None:
-            return a
-        elif name in super().__getattribute__("__dict__"):
-            return super().__getattribute__(self, name)
-        else:
+        # Only called once normal attribute lookup failed
+        try:
+            return self[name]
+        except KeyError:
+            if name[:2] == "__":
+                raise AttributeError(name) from None
             return None
 
     __setattr__ = dict.__setitem__
     __delattr__ = dict.__delitem__
 
 
+short_repr = reprlib.Repr()
+"""Bounded repr of the contents of Serializable objects"""
+short_repr.maxlevel = 3
+short_repr.maxdict = 8
+short_repr.maxlist = 8
+short_repr.maxstring = 40
+short_repr.maxother = 60
+
+
 class Serializable(DotDict):
     def toJson(self):
-        return json.dumps(self, indent=4)
-
-    def __str__(self):
-        return json.dumps(self, indent=4, ensure_ascii=False)
+        """Serializes the whole object as pretty-printed JSON"""
+        return json.dumps(self, indent=4, default=serializable)
 
     def __repr__(self):
-        return self.__str__()
+        # Bounded, so logging or inspecting a whole snapshot stays cheap
+        return f"{type(self).__name__}({short_repr.repr(dict(self))})"
+
+    __str__ = __repr__
 
 
 class AdsbAircraft(Serializable):
@@ -33,7 +48,7 @@ class AdsbAircraft(Serializable):
     "24-bit ICAO aircraaircraft:ft address"
     seen_pos: float
     "how long ago since \'now\' timestamp position was updated"
-    seen_pos: float
+    seen: float
     "how long ago since last \'now\' timesetamp since message was received"
     lon: int
     "longitude in decimal degrees"
@@ -53,6 +68,8 @@ class AdsbAircraft(Serializable):
     "selected altitude from the Flight Manaagement System (FMS) (2.2.3.2.7.1.3.3)"
     nav_heading: float
     "selected heading (True or Magnetic is not defined in DO-260B, mostly Magnetic as that is the de facto standard) (2.2.3.2.7.1.3.7)"
+    squawk: str
+    "Mode A code (Squawk), encoded as 4 octal digits"
     gs: float
     "ground speed in knots"
     roll: float
@@ -82,6 +99,51 @@ class AdsbAircraft(Serializable):
     nav_modes: str
     "set of engaged automation modes: autopilot, vnav, althold, approach, lnav, tcas"
 
+    fields = (
+        "hex", "seen_pos", "seen", "lon", "lat", "baro_rate", "geom_rate", "alt_baro", "alt_geom",
+        "nav_altitude_mcp", "nav_altitude_fms", "nav_qnh", "nav_heading", "squawk", "gs", "mach", "roll",
+        "track", "track_rate", "mag_heading", "true_heading", "wd", "ws", "oat", "tat", "tas", "ias", "rc",
+        "messageRate", "category", "nic", "nav_modes", "emergency", "type", "airground", "nav_altitude_src",
+        "sil_type", "adsb_version", "adsr_version", "tisb_version", "nac_p", "nac_v", "sil", "gva", "sda",
+        "nic_a", "nic_c", "flight", "dbFlags", "t", "r", "rssi", "extraFlags", "nogps", "nic_baro", "alert1", "spi",
+    )
+    """Keys of an aircraft decoded from bincraft, in order"""
+
+    nullable_ints = {
+        "baro_rate", "geom_rate", "alt_baro", "alt_geom", "nav_altitude_mcp", "nav_altitude_fms",
+        "wd", "ws", "oat", "tat", "tas", "ias", "emergency", "nav_altitude_src", "nac_p", "nac_v",
+        "sil", "gva", "sda", "nic_a", "nic_c", "nic_baro", "alert1", "spi", "nav_modes",
+    }
+    """Columns that are stored as floats (NaN when void) but hold integer values"""
+
+    nav_mode_names = ["autopilot", "vnav", "alt_hold", "approach", "lnav", "tcas"]
+    """Names of the nav_modes bits, lowest bit first"""
+
+    @staticmethod
+    def from_columns(columns: dict, i: int, keys=fields) -> "AdsbAircraft":
+        """Builds the aircraft at row i of decoded bincraft columns.
+        @columns: The aircraft columns, either as arrays or as lists.
+        @i: The index of the aircraft.
+        @keys: The keys of the aircraft, in order, all fields by default.
+        """
+        ac = AdsbAircraft()
+        for key in keys:
+            value = columns[key][i]
+            if isinstance(value, np.generic):
+                value = value.item()
+            if isinstance(value, float):
+                if value != value:
+                    value = None
+                elif key in AdsbAircraft.nullable_ints:
+                    value = int(value)
+            ac[key] = value
+        if columns["airground"][i] == 1 and "alt_baro" in ac:
+            ac["alt_baro"] = "ground"
+        if ac.get("nav_modes") is not None:
+            modes = ac["nav_modes"]
+            ac["nav_modes"] = [name for bit, name in enumerate(AdsbAircraft.nav_mode_names) if modes & 1 << bit]
+        return ac
+
 
 class AdsbSnapshot(Serializable):
     """Represents a snapshot taken from bincraft."""
@@ -126,6 +188,62 @@ class AdsbSnapshot(Serializable):
     "Aircrafts in this snapshot"
 
 
+class AircraftColumns(Sequence):
+    """Sequence of aircraft backed by decoded bincraft column arrays.
+    AdsbAircraft rows are only built when they are accessed."""
+
+    def __init__(self, columns: dict) -> None:
+        self.columns = columns
+        "Arrays of aircraft attributes, keyed by attribute name"
+
+    def __len__(self) -> int:
+        return len(self.columns["hex"])
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("aircraft index out of range")
+        return AdsbAircraft.from_columns(self.columns, index)
+
+    def __iter__(self):
+        # Plain lists index much faster than arrays when every row is visited
+        lists = {key: self.columns[key].tolist() for key in AdsbAircraft.fields}
+        for i in range(len(self)):
+            yield AdsbAircraft.from_columns(lists, i)
+
+    def __repr__(self) -> str:
+        return f"AircraftColumns({len(self)} aircraft)"
+
+    def select(self, mask) -> "AircraftColumns":
+        """Selects a subset of aircraft.
+        @mask: Boolean mask or index array over the aircraft.
+        """
+        return AircraftColumns({key: column[mask] for key, column in self.columns.items()})
+
+
+class AdsbColumnarSnapshot(Serializable):
+    """Represents a snapshot taken from bincraft, with the aircraft held as column arrays.
+    Behaves like AdsbSnapshot, but aircraft is an AircraftColumns sequence."""
+
+    def __init__(self, data: dict) -> None:
+        """Initialize from bincraft data with aircraft columns"""
+        for key in AdsbSnapshot.__annotations__.keys():
+            if key in data and key != "aircraft":
+                self[key] = data[key]
+        self.aircraft = AircraftColumns(data["aircraft"])
+
+    @property
+    def columns(self) -> dict:
+        """Arrays of aircraft attributes, keyed by attribute name"""
+        return self["aircraft"].columns
+
+    aircraft: AircraftColumns
+    "Aircrafts in this snapshot"
+
+
 class AdsbTrace(Serializable):
     """Encapsulates ADSB trace data from adsbexchange.com"""
 
@@ -151,8 +269,8 @@ class AdsbTrace(Serializable):
     timestamp: str
     """The timestamp of the Trace in Unix Epoch seconds"""
 
-    states: list
-    """List of states captured by trace"""
+    states: "TraceStates"
+    """States captured by trace, held as column arrays"""
 
     def __init__(self, data) -> None:
         data = DotDict(data)
@@ -166,9 +284,7 @@ class AdsbTrace(Serializable):
         self.registration_num = data.r
         self.model_num = data.t
         self.timestamp = data.timestamp
-        self.states = []
-        for state in data.trace:
-            self.states.append(AdsbTraceState(state))
+        self.states = TraceStates.from_trace(data.trace or [])
 
 
 class AdsbTraceState(Serializable):
@@ -219,9 +335,127 @@ class AdsbTraceState(Serializable):
         # self.rId = state[14];
 
 
+class TraceStates(Sequence):
+    """Sequence of trace states backed by typed column arrays, one per state field.
+    AdsbTraceState rows are only built when they are accessed."""
+
+    fields = ("timedelta", "latitude", "longitude", "altitude", "gs", "track", "climb_rate", "data", "type",
+              "geom_alt", "geom_rate", "ias", "roll")
+    "State keys in the order of AdsbTraceState"
+
+    numeric = {"timedelta": 0, "latitude": 1, "longitude": 2, "altitude": 3, "gs": 4, "track": 5, "climb_rate": 7,
+               "geom_alt": 10, "geom_rate": 11, "ias": 12, "roll": 13}
+    "Position in a raw trace state of each numeric field"
+
+    def __init__(self, columns: dict, integral: set, types: list, whole: dict = None) -> None:
+        self.columns = columns
+        """Arrays of state fields keyed by field name. Numeric fields are floats with NaN for missing values,
+        ground is True where the altitude was 'ground', type holds indices into types and data the raw details"""
+        self.integral = integral
+        "Numeric fields whose values were all whole numbers, rendered as int"
+        self.whole = whole or {}
+        "Numeric fields mixing ints and floats, with a boolean array of the values that were ints, rendered as int"
+        self.types = types
+        "Distinct values of the type field"
+
+    @staticmethod
+    def from_trace(trace: list) -> "TraceStates":
+        """Builds the columns from the raw state arrays of a trace"""
+        count = len(trace)
+        rows = [state[:14] if len(state) >= 14 else list(state) + [None] * (14 - len(state)) for state in trace]
+        fields = list(zip(*rows)) if count else [()] * 14
+
+        columns = {}
+        integral = set()
+        whole = {}
+        for name, i in TraceStates.numeric.items():
+            values = fields[i]
+            if name == "altitude":
+                columns["ground"] = np.array([value == "ground" for value in values], dtype=bool)
+                values = [None if value == "ground" else value for value in values]
+            # None converts to NaN
+            column = np.array(values, dtype=np.float64)
+            kinds = set(map(type, values))
+            if float not in kinds:
+                integral.add(name)
+                # Whole numbers below 2^24 are exact in float32, which halves the column
+                if not np.nanmax(np.abs(column), initial=0) >= 2 ** 24:
+                    column = column.astype(np.float32)
+            elif int in kinds:
+                # adsbexchange writes e.g. a level roll as 0 among -1.4 and 2.1, so ints are kept per value
+                whole[name] = np.array([type(value) is int for value in values], dtype=bool)
+            columns[name] = column
+
+        # Geometric altitude and rate are only valid when flagged
+        flags = np.nan_to_num(np.array(fields[6], dtype=np.float64)).astype(np.int64)
+        columns["geom_alt"][(flags & 8) == 0] = np.nan
+        columns["geom_rate"][(flags & 4) == 0] = np.nan
+
+        missing = np.array([value is None for value in fields[9]], dtype=bool)
+        types, codes = np.unique([value for value in fields[9] if value is not None], return_inverse=True)
+        columns["type"] = np.full(count, -1, dtype=np.int16)
+        columns["type"][~missing] = codes
+        columns["data"] = list(fields[8])
+        return TraceStates(columns, integral, types.tolist(), whole)
+
+    def __len__(self) -> int:
+        return len(self.columns["timedelta"])
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("state index out of range")
+        return self.__state({key: column[index:index + 1].tolist() for key, column in self.columns.items() if key != "data"},
+                            {key: mask[index:index + 1].tolist() for key, mask in self.whole.items()}, 0,
+                            self.columns["data"][index])
+
+    def __iter__(self):
+        # Plain lists index much faster than arrays when every row is visited
+        lists = {key: column.tolist() for key, column in self.columns.items() if key != "data"}
+        whole = {key: mask.tolist() for key, mask in self.whole.items()}
+        for i, data in enumerate(self.columns["data"]):
+            yield self.__state(lists, whole, i, data)
+
+    def __repr__(self) -> str:
+        return f"TraceStates({len(self)} states)"
+
+    def __state(self, lists: dict, whole: dict, i: int, data) -> "AdsbTraceState":
+        """Builds the AdsbTraceState of a row"""
+        state = AdsbTraceState.__new__(AdsbTraceState)
+        for key in TraceStates.fields:
+            if key == "data":
+                value = data
+            elif key == "type":
+                value = self.types[lists[key][i]] if lists[key][i] >= 0 else None
+            elif key == "altitude" and lists["ground"][i]:
+                value = "ground"
+            else:
+                value = lists[key][i]
+                if value != value:
+                    value = None
+                elif key in self.integral or key in whole and whole[key][i]:
+                    value = int(value)
+            state[key] = value
+        return state
+
+
 import json
 
 
+def serializable(obj):
+    """Converts the lazy sequences and NumPy values held by the classes into JSON-serializable objects"""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, Sequence):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 def write_dict(dict, filename):
     with open(filename, "wt") as f:
         f.write(json.dumps(dict, indent=4))
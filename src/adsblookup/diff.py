@@ -0,0 +1,78 @@
+"""diff.py compares successive snapshots, so consumers can look at the aircraft that changed only.
+Two snapshots are aligned by hex in one vectorized join, and the aircraft that appeared, departed or moved beyond
+thresholds are returned as index arrays into the snapshots. The seen and seen_pos ages tell live aircraft and fresh
+positions from the stale ones adsbexchange.com keeps listing for a while after their last message."""
+
+from classes import AdsbColumnarSnapshot, DotDict
+from spatial import distance_nm
+import numpy as np
+
+fields = {"hex": str, "lat": float, "lon": float, "alt_baro": float, "squawk": object, "seen": float, "seen_pos": float}
+"""Aircraft columns compared, with their types when they are gathered from a snapshot of records"""
+
+
+def columns(snapshot) -> dict:
+    """The compared aircraft columns of an AdsbColumnarSnapshot, or of an AdsbSnapshot of records"""
+    if isinstance(snapshot, AdsbColumnarSnapshot):
+        gathered = {name: snapshot.columns[name] for name in fields}
+        # Records read "ground" for the altitude of aircraft on the ground, which is compared as NaN
+        gathered["alt_baro"] = np.where(snapshot.columns["airground"] == 1, np.nan, gathered["alt_baro"])
+        return gathered
+    aircraft = snapshot.aircraft or []
+    gathered = {}
+    for name, kind in fields.items():
+        values = [ac.get(name) for ac in aircraft]
+        if kind is float:
+            # Records hold None for missing values and "ground" for the altitude of aircraft on the ground
+            values = [value if isinstance(value, (int, float)) else np.nan for value in values]
+        gathered[name] = np.array(values, dtype=kind) if values else np.empty(0, dtype=kind)
+    return gathered
+
+
+def diff(previous, current, distance: float = 0.5, altitude: float = 200, max_seen: float = 60,
+         max_seen_pos: float = 60) -> DotDict:
+    """Finds the aircraft that changed between two snapshots.
+    @previous: The earlier snapshot, columnar or of records.
+    @current: The later snapshot, of the same kind.
+    @distance: Distance in nautical miles an aircraft must have moved to count as moved.
+    @altitude: Change of barometric altitude in feet that counts as moved.
+    @max_seen: Seconds since the last message after which an aircraft counts as gone, so it departs when it goes stale.
+    @max_seen_pos: Seconds since the last position after which a position is stale and changes of it are ignored.
+    Returns a DotDict of sorted index arrays: appeared (into current), departed (into previous), moved (into current)
+    and moved_from (the same aircraft in previous), changed (appeared and moved, into current), and booleans aligned
+    with moved telling whether the position, altitude or squawk changed.
+    """
+    before, after = columns(previous), columns(current)
+    # A duplicated hex is represented by its first row
+    live_before = np.flatnonzero(~(before["seen"] > max_seen))
+    live_after = np.flatnonzero(~(after["seen"] > max_seen))
+    hexes_before, first = np.unique(before["hex"][live_before], return_index=True)
+    hexes_after, second = np.unique(after["hex"][live_after], return_index=True)
+    live_before, live_after = live_before[first], live_after[second]
+
+    common, i, j = np.intersect1d(hexes_before, hexes_after, assume_unique=True, return_indices=True)
+    appeared = np.delete(live_after, j)
+    departed = np.delete(live_before, i)
+    old, new = live_before[i], live_after[j]
+
+    lat, lon = after["lat"][new], after["lon"][new]
+    fresh = ~(after["seen_pos"][new] > max_seen_pos) & np.isfinite(lat) & np.isfinite(lon)
+    # A position that was missing before counts as a move
+    moved_by = distance_nm(before["lat"][old], before["lon"][old], lat, lon)
+    position = fresh & ~(moved_by < distance)
+    climbed = np.abs(after["alt_baro"][new] - before["alt_baro"][old])
+    elevation = climbed >= altitude
+    squawk = after["squawk"][new] != before["squawk"][old]
+
+    # Rows come out in hex order, they are returned in snapshot order
+    moved = np.flatnonzero(position | elevation | squawk)
+    moved = moved[np.argsort(new[moved])]
+    return DotDict(appeared=np.sort(appeared), departed=np.sort(departed), moved=new[moved], moved_from=old[moved],
+                   changed=np.sort(np.concatenate([appeared, new[moved]])),
+                   position=position[moved], altitude=elevation[moved], squawk=squawk[moved])
+
+
+def subset(snapshot: AdsbColumnarSnapshot, rows) -> AdsbColumnarSnapshot:
+    """Keeps only some aircraft of a columnar snapshot, e.g. changed of diff, to score them alone"""
+    rows = np.asarray(rows, dtype=np.intp)
+    return AdsbColumnarSnapshot(dict(snapshot, aircraft={name: values[rows] for name, values in snapshot.columns.items()}))
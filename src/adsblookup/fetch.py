@@ -0,0 +1,214 @@
+"""fetch.py is the HTTP layer shared by the adsbexchange.com fetchers.
+Requests go through one pooled keep-alive session with timeouts and bounded, jittered retries.
+Responses fetched conditionally are revalidated with ETag/If-Modified-Since, and every request's latency and size is recorded."""
+
+from classes import DotDict
+from collections import OrderedDict, deque
+import metrics
+import os
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+
+base_url = os.environ['ADSB_URL'] if 'ADSB_URL' in os.environ else "https://globe.adsbexchange.com"
+"""Root URL of the adsbexchange.com API, can be pointed at a local server serving recorded responses"""
+
+retry_statuses = {429, 500, 502, 503, 504}
+"""Status codes that are worth retrying"""
+
+
+class FetchStats:
+    """Counters for the requests made by a Fetcher"""
+
+    def __init__(self, history: int = 1000) -> None:
+        self.__lock = threading.Lock()
+        self.requests = 0
+        "Number of requests sent, retries included"
+        self.retries = 0
+        "Number of requests that were retries"
+        self.failures = 0
+        "Number of requests that raised or returned a retryable status"
+        self.not_modified = 0
+        "Number of conditional requests answered from the cache"
+        self.bytes = 0
+        "Number of response body bytes received"
+        self.latencies = deque(maxlen=history)
+        "Latencies in seconds of the most recent requests"
+
+    def record(self, latency: float, size: int, failed: bool = False, retry: bool = False,
+               not_modified: bool = False) -> None:
+        """Records a single request"""
+        with self.__lock:
+            self.requests += 1
+            self.retries += retry
+            self.failures += failed
+            self.not_modified += not_modified
+            self.bytes += size
+            self.latencies.append(latency)
+        metrics.observe("http", latency)
+        metrics.count("http_requests")
+        metrics.count("http_bytes", size)
+        if failed: metrics.count("http_failures")
+
+    def summary(self) -> DotDict:
+        """Summarizes the counters and latency percentiles in seconds"""
+        with self.__lock:
+            latencies = sorted(self.latencies)
+            summary = DotDict(requests=self.requests, retries=self.retries, failures=self.failures,
+                              not_modified=self.not_modified, bytes=self.bytes)
+        for name, q in (("p50", 0.5), ("p90", 0.9), ("p99", 0.99)):
+            summary[name] = latencies[min(int(q * len(latencies)), len(latencies) - 1)] if latencies else None
+        return summary
+
+
+class Fetcher:
+    """Pooled HTTP session with timeouts, retries and conditional requests"""
+
+    def __init__(self, timeout=(5, 30), retries: int = 3, backoff: float = 0.5, pool_size: int = 16,
+                 cache_size: int = 1024) -> None:
+        """
+        @timeout: Connect and read timeouts in seconds.
+        @retries: Number of times a failed request is retried.
+        @backoff: Base delay in seconds, doubled on every retry and randomized with full jitter.
+        @pool_size: Number of keep-alive connections kept per host.
+        @cache_size: Number of conditionally fetched responses kept for revalidation.
+        """
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.cache_size = cache_size
+        self.stats = FetchStats()
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.__cache = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def get(self, url: str, headers: dict = None, conditional: bool = False) -> DotDict:
+        """GETs a URL, retrying connection errors, timeouts and retryable statuses.
+        @url: The URL to fetch.
+        @headers: Additional request headers.
+        @conditional: If True, revalidates a previously fetched copy and returns it when unchanged.
+        Returns a DotDict with the status, content and headers of the response, and whether it came from the cache.
+        Raises the last requests exception when every attempt fails to connect.
+        """
+        headers = dict(headers or {})
+        cached = None
+        if conditional:
+            with self.__lock:
+                cached = self.__cache.get(url)
+            if cached is not None:
+                if cached.etag: headers['If-None-Match'] = cached.etag
+                if cached.last_modified: headers['If-Modified-Since'] = cached.last_modified
+
+        for attempt in range(self.retries + 1):
+            if attempt > 0:
+                time.sleep(random.uniform(0, self.backoff * 2 ** (attempt - 1)))
+            start = time.perf_counter()
+            try:
+                response = self.session.get(url, headers=headers, timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout):
+                self.stats.record(time.perf_counter() - start, 0, failed=True, retry=attempt > 0)
+                if attempt == self.retries:
+                    raise
+                continue
+            latency = time.perf_counter() - start
+            content = response.content
+
+            if response.status_code in retry_statuses and attempt < self.retries:
+                self.stats.record(latency, len(content), failed=True, retry=attempt > 0)
+                continue
+
+            if response.status_code == 304 and cached is not None:
+                self.stats.record(latency, len(content), retry=attempt > 0, not_modified=True)
+                with self.__lock:
+                    self.__cache.move_to_end(url)
+                return DotDict(status=200, content=cached.content, headers=response.headers, cached=True)
+
+            self.stats.record(latency, len(content), failed=response.status_code >= 400, retry=attempt > 0)
+            if conditional and response.status_code == 200:
+                self.__store(url, response)
+            return DotDict(status=response.status_code, content=content, headers=response.headers, cached=False)
+
+    def __store(self, url: str, response: requests.Response) -> None:
+        """Keeps a response for later revalidation, evicting the least recently used ones"""
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if etag is None and last_modified is None:
+            return
+        with self.__lock:
+            self.__cache[url] = DotDict(etag=etag, last_modified=last_modified, content=response.content)
+            self.__cache.move_to_end(url)
+            while len(self.__cache) > self.cache_size:
+                self.__cache.popitem(last=False)
+
+
+__fetcher = None
+"""Fetcher shared by every module"""
+
+__fetcher_lock = threading.Lock()
+
+
+def fetcher() -> Fetcher:
+    """Returns the shared Fetcher, creating it on first use"""
+    global __fetcher
+    with __fetcher_lock:
+        if __fetcher is None:
+            __fetcher = Fetcher()
+        return __fetcher
+
+
+def configure(**kwargs) -> Fetcher:
+    """Replaces the shared Fetcher with one built from the given Fetcher arguments"""
+    global __fetcher
+    with __fetcher_lock:
+        __fetcher = Fetcher(**kwargs)
+        return __fetcher
+
+
+class LiveSource:
+    """Serves snapshots and traces from adsbexchange.com through the shared Fetcher.
+    pull_snapshot, pull_trace and the Harvester accept any object with the same methods and host attribute,
+    such as a capture.Recorder recording this source or a capture.Replay of recorded traffic."""
+
+    @property
+    def host(self) -> str:
+        """Host the requests are sent to, used to rate limit them"""
+        return urlsplit(base_url).netloc
+
+    def snapshot(self, box: tuple) -> DotDict:
+        """GETs the ZSTD compressed bincraft of a bounding box formatted as (lat_min, lat_max, lon_min, lon_max).
+        Returns the response as Fetcher.get does."""
+        headers = {
+            'authority': 'globe.adsbexchange.com',
+            'accept': '*/*',
+            'accept-language': 'en-US,en;q=0.9,zh-CN;q=0.8,zh;q=0.7',
+            'referer': 'https://globe.adsbexchange.com/',
+            'x-requested-with': 'XMLHttpRequest',
+        }
+        # e.g. https://globe.adsbexchange.com/re-api/?binCraft&zstd&box=32.046128,47.578514,-95.884649,-65.435871
+        url = f'{base_url}/re-api/?binCraft&zstd&box={box[0]},{box[1]},{box[2]},{box[3]}'
+        return fetcher().get(url, headers=headers)
+
+    def trace(self, icao: str, recent: bool = False) -> DotDict:
+        """GETs the trace JSON of an aircraft.
+        @icao: The lowercase 6 digit hex code of the aircraft.
+        @recent: If True, gets only the last 1-2 hours of the trace instead of the full 25 hours.
+        Returns the response as Fetcher.get does.
+        """
+        # ADSB provides trace data for individual aircraft in the following scheme
+        # We can choose to pull the full trace (up to 25 hours of history) with "trace_full_{icao}.json"
+        #   or the last hour
+        # URL subdirectory uses last 2 characters of icao
+        kind = "recent" if recent else "full"
+        url = f'{base_url}/data/traces/{icao[-2:]}/trace_{kind}_{icao}.json'
+        # Traces are revalidated, so an unchanged trace is not transferred again
+        return fetcher().get(url, headers={'referer': 'https://globe.adsbexchange.com'}, conditional=True)
+
+
+live = LiveSource()
+"""Source used when none is given"""
@@ -0,0 +1,169 @@
+#!/usr/bin/python3
+"""framestore.py stores harvested frames as chunks of a NumPy structured array.
+A store is a directory of immutable .npy chunks whose names carry their time range, so appends never rewrite
+existing data, time-range reads skip whole chunks by name, and chunks are memory mapped when read.
+Run as a script to import airport CSVs written by earlier versions of project.py: framestore.py KCOS.csv KDEN.csv"""
+
+from scoring import feature_names
+from utils import data
+import math
+import os
+import re
+import numpy as np
+
+dtype = np.dtype([
+    ("icao", "S7"),
+    ("timestamp", "<f8"),
+    ("lat", "<f8"),
+    ("lon", "<f8"),
+    ("alt", "<f4"),
+    ("grad", "<f4"),
+    ("airport", "S8"),
+])
+"""Layout of a frame. Timestamps are Unix epoch seconds, NaN when unknown"""
+
+chunk_name = re.compile(r"^(\d+)_(-?\d+)_(-?\d+)\.npy$")
+"""Chunk file names: sequence number, first and last timestamp"""
+
+
+def records(icao, timestamp, lat, lon, alt, grad, airport) -> np.ndarray:
+    """Builds frames from columns, scalars are repeated for every frame"""
+    columns = (icao, timestamp, lat, lon, alt, grad, airport)
+    # Only arrays count, so empty columns build no frames instead of one
+    count = max((len(column) for column in columns if np.ndim(column) > 0), default=1)
+    frames = np.empty(count, dtype=dtype)
+    for name, column in zip(dtype.names, columns):
+        frames[name] = column
+    return frames
+
+
+class FrameStore:
+    """Directory of frame chunks"""
+
+    def __init__(self, directory: str = os.path.join(data, "frames"), chunk_size: int = 65536) -> None:
+        """
+        @directory: Directory of the chunks, created when the first chunk is written.
+        @chunk_size: Number of appended frames buffered before a chunk is written.
+        """
+        self.directory = directory
+        self.chunk_size = chunk_size
+        self.__buffer = []
+        self.__buffered = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.flush()
+
+    def __len__(self) -> int:
+        return sum(len(np.load(name, mmap_mode="r")) for name, start, end in self.chunks()) + self.__buffered
+
+    def chunks(self) -> list:
+        """Lists the written chunks as (filename, first timestamp, last timestamp), oldest first"""
+        found = []
+        if not os.path.isdir(self.directory):
+            return found
+        for name in os.listdir(self.directory):
+            match = chunk_name.match(name)
+            if match is not None:
+                found.append((int(match[1]), os.path.join(self.directory, name), int(match[2]), int(match[3])))
+        return [(name, start, end) for sequence, name, start, end in sorted(found)]
+
+    def append(self, frames: np.ndarray) -> None:
+        """Appends frames built by records, writing a chunk whenever enough are buffered"""
+        if len(frames) == 0:
+            return
+        self.__buffer.append(np.asarray(frames, dtype=dtype))
+        self.__buffered += len(frames)
+        if self.__buffered >= self.chunk_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Writes the buffered frames as a new chunk"""
+        if self.__buffered == 0:
+            return
+        frames = np.concatenate(self.__buffer)
+        self.__buffer = []
+        self.__buffered = 0
+
+        chunks = self.chunks()
+        sequence = int(os.path.basename(chunks[-1][0]).split("_")[0]) + 1 if chunks else 0
+        known = frames["timestamp"][np.isfinite(frames["timestamp"])]
+        start = math.floor(known.min()) if len(known) else 0
+        end = math.ceil(known.max()) if len(known) else 0
+        name = os.path.join(self.directory, f"{sequence:08d}_{start}_{end}.npy")
+        os.makedirs(self.directory, exist_ok=True)
+        # Written under a temporary name, so readers never see a partial chunk
+        with open(name + ".tmp", "wb") as file:
+            np.save(file, frames)
+        os.replace(name + ".tmp", name)
+
+    def read(self, start: float = None, end: float = None, airport: str = None, mmap: bool = True) -> np.ndarray:
+        """Reads the written frames.
+        @start: If given, only frames at or after this timestamp are read.
+        @end: If given, only frames before this timestamp are read.
+        @airport: If given, only the frames of this airport are read.
+        @mmap: If True, chunks are memory mapped instead of read into memory. A single unfiltered chunk is returned mapped.
+        """
+        parts = []
+        for name, first, last in self.chunks():
+            if (start is not None and last < start) or (end is not None and first >= end):
+                continue
+            frames = np.load(name, mmap_mode="r" if mmap else None)
+            mask = None
+            if start is not None or end is not None:
+                timestamp = frames["timestamp"]
+                mask = np.ones(len(frames), dtype=bool)
+                if start is not None: mask &= timestamp >= start
+                if end is not None: mask &= timestamp < end
+            if airport is not None:
+                selected = frames["airport"] == airport.encode()
+                mask = selected if mask is None else mask & selected
+            parts.append(frames if mask is None else frames[mask])
+
+        if not parts:
+            return np.empty(0, dtype=dtype)
+        return parts[0] if len(parts) == 1 else np.concatenate(parts)
+
+    def airports(self) -> list:
+        """Lists the airports that have frames"""
+        found = set()
+        for name, first, last in self.chunks():
+            found.update(np.unique(np.load(name, mmap_mode="r")["airport"]).tolist())
+        return sorted(airport.decode() for airport in found)
+
+    def features(self, airport: str = None, max_alt: float = None, **kwargs) -> np.ndarray:
+        """Reads frames as a feature matrix with the columns of scoring.feature_names, for training.
+        @airport: If given, only the frames of this airport are read.
+        @max_alt: If given, frames at or above this altitude are left out.
+        Other arguments are passed to read.
+        """
+        frames = self.read(airport=airport, **kwargs)
+        x = np.column_stack([frames[name].astype(np.float64) for name in feature_names])
+        x = x[np.isfinite(x).all(axis=1)]
+        if max_alt is not None:
+            x = x[x[:, feature_names.index("alt")] < max_alt]
+        return x
+
+
+def import_csv(filename: str, store: FrameStore, airport: str = None) -> int:
+    """Imports an airport CSV written by earlier versions of project.py.
+    The CSVs kept neither the aircraft nor the time of a frame, so both are left empty.
+    @airport: The airport of the frames, the file's name without extension by default.
+    Returns the number of frames imported.
+    """
+    import pandas as pd
+    if airport is None:
+        airport = os.path.splitext(os.path.basename(filename))[0]
+    x = pd.read_csv(filename, header=None, usecols=range(len(feature_names))).dropna().to_numpy(np.float64)
+    store.append(records("", np.nan, x[:, 0], x[:, 1], x[:, 2], x[:, 3], airport))
+    store.flush()
+    return len(x)
+
+
+if __name__ == "__main__":
+    import sys
+    with FrameStore() as store:
+        for filename in sys.argv[1:]:
+            print(filename + " imported with " + str(import_csv(filename, store)) + " frames...")
@@ -1,11 +1,17 @@
 import sys
+import os
 import pandas as pd
 import numpy as np
 import geopandas as gpd
 import matplotlib.pyplot as plt
-from pyod.models.iforest import IForest
 
 from bincraft import *
+from spatial import GridIndex
+from scoring import RegionScorer, snapshot_features
+import basemap
+import models
+from capture import Replay
+from framestore import FrameStore, import_csv
 
 from PyQt5.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QWidget, QLabel
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
@@ -22,24 +28,25 @@ class FlightMap(QWidget):
         self.label = QLabel("Click a flight to view details", self)
         self.label.setStyleSheet("font-size: 16px; padding: 5px;")
 
-        # Load world map
-        url = "https://naciscdn.org/naturalearth/110m/cultural/ne_110m_admin_0_countries.zip"
-        world = gpd.read_file(url)
+        # Load world map, cached locally
+        world = basemap.load(basemap.countries_url, (25, 50, -150, -60))
 
         # Flight data
         self.flights = flights
         df = pd.DataFrame(self.flights)
         self.gdf = gpd.GeoDataFrame(df, geometry=gpd.points_from_xy(df.longitude, df.latitude), crs="EPSG:4326")
+        self.index = GridIndex(df.latitude.values, df.longitude.values, cell=0.5)
 
         # Create Matplotlib figure
         self.fig, self.ax = plt.subplots(figsize=(8, 6))
-        world.clip([-150, 25, -60, 50]).plot(ax=self.ax, color="white", edgecolor="black")
+        world.plot(ax=self.ax, color="white", edgecolor="black")
         self.scatter = self.gdf.plot(ax=self.ax, color="red")
         self.ax.set_title("Live Flight Tracking Map")
 
         # Embed into PyQt
         self.canvas = FigureCanvas(self.fig)
         self.canvas.mpl_connect("button_press_event", self.on_click)
+        self.canvas.mpl_connect("motion_notify_event", self.on_click)
         layout = QVBoxLayout()
         layout.addWidget(self.canvas)
         layout.addWidget(self.label)
@@ -51,18 +58,10 @@ class FlightMap(QWidget):
         
         click_lon, click_lat = event.xdata, event.ydata
 
-        min_dist = float("inf")
-        closest_flight = None
-
-        for flight in self.flights:
-            distx = flight["latitude"] - click_lat
-            disty = flight["longitude"] - click_lon
-            dist = distx**2 + disty**2
-            if dist < min_dist:
-                min_dist = dist
-                closest_flight = flight
-        
-        if closest_flight != None and min_dist <=1:
+        # Flights within a degree of the click, as before, but measured in nautical miles
+        index, _ = self.index.nearest(click_lat, click_lon, 60)
+        if index is not None:
+            closest_flight = self.flights[index]
             info = (
                 f"Flight ID: {closest_flight['ID']}\n"
                 f"Lat: {closest_flight['latitude']}, Lon: {closest_flight['longitude']}\n"
@@ -93,36 +92,24 @@ if __name__ == "__main__":
     fig, ax = plt.subplots()
     #plt.show()
     limits = [lat - range / 60, lat + range / 60, lon - (range / 60) / math.cos(latr), lon + (range / 60) / math.cos(latr)]
-    file = open("KCOS.csv")
-    frames = file.read()
-    file.close()
-    frames = [np.array([float(col) for col in row.split(",") if len(col) > 0]) for row in frames.strip().split("\n")]
-    frames = [frame for frame in frames if frame[2] < 20000]
-    x = np.array(frames)
-    forest = IForest(max_samples=len(x))
-    forest.fit(x)
+    # Every frame of the model's training data, as before, with the seed fixed for reproducible scores
+    store = FrameStore()
+    if "KCOS" not in store.airports():
+        import_csv(os.path.join(models.csv_directory, "KCOS.csv"), store)
+    forest = models.load_airport(store, "KCOS", max_alt=20000, contamination=0.1, max_samples=1.0).estimator
+    scorer = RegionScorer([("COS", lat, lon, forest)], radius=range)
+    # map.py traffic.cap replays a recorded capture in real time instead of pulling live snapshots
+    source = Replay(sys.argv[1], speed=1, loop=True) if len(sys.argv) > 1 else None
 
     while True:
         ax.clear()
-        snap = pull_snapshot(limits)
-        states = [
-            [
-                #state["hex"],
-                state["lat"],
-                state["lon"],
-                (state["alt_baro"] if state["alt_baro"] != "ground" else 0),
-                60 * (0 if state["baro_rate"] is None else state["baro_rate"]) / state["gs"]
-            ]
-            for state in snap.aircraft
-            if state["category"] in ["A3", "A4", "A5"] and (state["gs"] or 1) > 50 and
-               ((state["lat"] or 1) - lat) ** 2 + (((state["lon"] or 1) - lon) / math.cos(latr)) ** 2 < (
-                           range / 60) ** 2
-        ]
-        ys = [state[0] for state in states]
-        xs = [state[1] for state in states]
-        outliers = forest.predict(np.array(states)) if len(states) > 0 else []
+        snap = pull_snapshot(limits, columnar=True, source=source)
+        features = snapshot_features(snap)
+        result = scorer.score(features)
+        monitored = result.region >= 0
+        outliers = result.labels[monitored]
         print(outliers)
-        ax.scatter(xs, ys, c=outliers, cmap="coolwarm")
+        ax.scatter(features.lon[monitored], features.lat[monitored], c=outliers, cmap="coolwarm")
         ax.set_xlim(limits[2], limits[3])
         ax.set_ylim(limits[0], limits[1])
         # Note that using time.sleep does *not* work here!
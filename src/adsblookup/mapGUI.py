@@ -5,19 +5,113 @@ os.environ["QT_QPA_PLATFORM_PLUGIN_PATH"] = (
     "/Users/emmanualmathew/Desktop/ADSBAnomalies/src/.venv/lib/python3.9/site-packages/PyQt5/Qt5/plugins/platforms"
 )
 import math
-import pandas as pd
+import threading
 import numpy as np
-import geopandas as gpd
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.colors import to_rgba_array
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QMainWindow, QApplication
-from PyQt5.QtCore import QTimer
-from pyod.models.iforest import IForest
+from PyQt5.QtCore import QObject, QThread, QTimer, Qt, pyqtSignal
 
 from bincraft import pull_snapshot
+from capture import Replay
+from classes import DotDict
+from spatial import GridIndex
+from scoring import RegionScorer, snapshot_features
+from tracks import TrackStore
+import basemap
+import metrics
+from models import ModelFleet
+
+class SnapshotWorker(QObject):
+    """Fetches, decodes and scores snapshots on a background thread.
+    Only the newest finished frame is kept: a frame the GUI has not taken yet is replaced and counted as dropped."""
+
+    ready = pyqtSignal()
+    "Emitted when a frame is waiting to be taken"
+    failed = pyqtSignal(str)
+    "Emitted with the error message when a snapshot could not be pulled or scored"
+
+    def __init__(self, box, scorer, interval=1000, source=None):
+        """
+        @box: Bounding box of the snapshots.
+        @scorer: The RegionScorer scoring the aircraft.
+        @interval: Time between snapshots in milliseconds.
+        @source: Where the snapshots come from, adsbexchange.com by default; see fetch.LiveSource.
+        """
+        super().__init__()
+        self.box = box
+        self.scorer = scorer
+        self.interval = interval
+        self.source = source
+        self.tracks = TrackStore()
+        "Recent positions of the aircraft, only touched on the worker thread"
+        self.frames = 0
+        "Number of frames produced"
+        self.dropped = 0
+        "Number of frames replaced before the GUI took them"
+        self.timer = None
+        self.__frame = None
+        self.__lock = threading.Lock()
+
+    def start(self):
+        """Starts pulling snapshots, must run on the worker thread"""
+        # A busy thread skips timeouts instead of queueing them, so slow fetches never pile up
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.tick)
+        self.timer.start(self.interval)
+        self.tick()
+
+    def tick(self):
+        """Pulls and scores one snapshot"""
+        # An exception escaping a Qt slot aborts the application, so every failure is reported instead
+        try:
+            snap = pull_snapshot(self.box, columnar=True, source=self.source)
+        except Exception as e:
+            metrics.count("snapshot_failures")
+            self.failed.emit(f"Snapshot failed: {e}")
+            return
+        try:
+            features = snapshot_features(snap)
+            self.tracks.update(snap)
+            metrics.gauge("tracked_aircraft", len(self.tracks))
+            frame = DotDict(features=features, result=self.scorer.score(features),
+                            tracks=self.tracks.features(features.hex))
+        except Exception as e:
+            metrics.count("scoring_failures")
+            self.failed.emit(f"Scoring failed: {e}")
+            return
+
+        with self.__lock:
+            stale = self.__frame is not None
+            self.__frame = frame
+            self.frames += 1
+            self.dropped += stale
+        metrics.count("frames")
+        metrics.count("dropped_frames", stale)
+        metrics.gauge("pending_frames", 1)
+        # A pending ready signal will pick up the newer frame
+        if not stale:
+            self.ready.emit()
+
+    def stop(self):
+        """Stops pulling snapshots, must run on the worker thread"""
+        if self.timer is not None:
+            self.timer.stop()
+
+    def take(self):
+        """Takes the newest frame, or None when there is none"""
+        with self.__lock:
+            frame, self.__frame = self.__frame, None
+        metrics.gauge("pending_frames", 0)
+        return frame
+
 
 class FlightMap(QWidget):
-    def __init__(self, parent=None):
+    stopping = pyqtSignal()
+    "Emitted to stop the worker's timer on the worker thread before the thread quits"
+
+    def __init__(self, parent=None, blit=True, source=None):
         super().__init__(parent)
 
         # Static config
@@ -30,32 +124,14 @@ class FlightMap(QWidget):
         self.limits = [self.lat - self.range / 60, self.lat + self.range / 60,
                        self.lon - self.range / math.cos(self.latr), self.lon + self.range / math.cos(self.latr)]
 
-        # Load US states
-        url = "https://naciscdn.org/naturalearth/10m/cultural/ne_10m_admin_1_states_provinces.zip"
-        allStates = gpd.read_file(url)
-        self.USStates = allStates[allStates["admin"] == "United States of America"]
-
-        # Data to train model with
-        df_DEN = pd.read_csv("KDEN.csv", usecols=[0,1,2,3], names=["lat", "lon", "alt", "grad"])
-        df_DEN.dropna(inplace=True)
-        df_COS = pd.read_csv("KCOS.csv", usecols=[0,1,2,3], names=["lat", "lon", "alt", "grad"])
-        df_COS.dropna(inplace=True)
-
-        # Extract only numerical features (not timestamp or icao24)
-        X_train_DEN = df_DEN[["lat", "lon", "alt", "grad"]].values
-        X_train_COS = df_COS[["lat", "lon", "alt", "grad"]].values
-        self.X_train_DEN = X_train_DEN
-        self.X_train_COS = X_train_COS
-
-        # Train Isolation Forest
-        self.model_DEN = IForest(contamination=0.01, max_samples="auto", random_state=42)
-        self.model_DEN.fit(X_train_DEN)
-        self.model_COS = IForest(contamination=0.01, max_samples="auto", random_state=42)
-        self.model_COS.fit(X_train_COS)
-
-        # Airports
-        self.denver = (39.8561, -104.6737)
-        self.cos = (38.8058, -104.7005)
+        # Load US states, cached locally and simplified to the map's resolution
+        extent = (self.lat_min, self.lat_max, self.lon_min, self.lon_max)
+        self.USStates = basemap.load(basemap.states_url, extent, {"admin": "United States of America"},
+                                     basemap.level_for(extent))
+
+        # One model per monitored airport, loaded from the cache unless its frames changed
+        self.fleet = ModelFleet()
+        self.scorer = self.fleet
 
         # Set up UI
         self.label = QLabel("Click a flight to view details", self)
@@ -64,18 +140,46 @@ class FlightMap(QWidget):
         self.fig, self.ax = plt.subplots(figsize=(8, 6))
         self.canvas = FigureCanvas(self.fig)
         self.canvas.mpl_connect("button_press_event", self.on_click)
+        self.canvas.mpl_connect("motion_notify_event", self.on_hover)
+        self.canvas.mpl_connect("draw_event", self.on_draw)
+
+        # Plotted flights, their spatial index and the hovered flight
+        self.flights = []
+        self.index = None
+        self.hovered = None
+
+        # Blitting redraws only the flights over a cached background of the static layers
+        self.blit = blit and self.canvas.supports_blit
+        self.background = None
+        self.palette = to_rgba_array(["blue", "red", "gray"])
+        self.draw_static()
 
         layout = QVBoxLayout()
         layout.addWidget(self.canvas)
         layout.addWidget(self.label)
         self.setLayout(layout)
 
-        # Start update timer
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_map)
-        self.timer.start(1000)
-
-    def update_map(self):
+        # Snapshots are fetched, decoded and scored on a worker thread, the GUI thread only draws them
+        self.thread = QThread(self)
+        self.worker = SnapshotWorker([self.lat_min, self.lat_max, self.lon_min, self.lon_max], self.scorer,
+                                     source=source)
+        self.worker.moveToThread(self.thread)
+        self.thread.started.connect(self.worker.start)
+        # Blocks until the worker stopped its timer, which belongs to the worker thread
+        self.stopping.connect(self.worker.stop, Qt.BlockingQueuedConnection)
+        self.worker.ready.connect(self.update_map)
+        self.worker.failed.connect(self.label.setText)
+        self.thread.start()
+
+    def stop(self):
+        """Stops the worker thread"""
+        if self.thread.isRunning():
+            self.stopping.emit()
+        self.thread.quit()
+        self.thread.wait()
+
+    def draw_static(self):
+        """Draws the layers that do not change between updates, and creates the flight artists"""
         self.ax.clear()
 
         self.ax.set_xlim(self.lon_min, self.lon_max)
@@ -83,72 +187,9 @@ class FlightMap(QWidget):
 
         # Base map and airports
         self.USStates.plot(ax=self.ax, color="white", edgecolor="black")
-        for name, (lat, lon) in {
-            "Denver (DEN)": self.denver,
-            "Colorado Springs (COS)": self.cos
-        }.items():
-            self.ax.plot(lon, lat, marker='s', color='green', markersize=6)
-            self.ax.text(lon + 0.2, lat, name, fontsize=9, color='green')
-
-        # Pull flight data
-        snap = pull_snapshot([self.lat_min, self.lat_max, self.lon_min, self.lon_max])
-        def distance_sq_nm(lat1, lon1, lat2, lon2):
-            latr = math.radians((lat1 + lat2) / 2)
-            return ((lat1 - lat2) ** 2 + ((lon1 - lon2) * math.cos(latr)) ** 2)
-
-        den_lat, den_lon = self.denver
-        cos_lat, cos_lon = self.cos
-
-        valid_aircraft = []
-        states = []
-        colors = []
-
-        for s in snap.aircraft:
-            if s.get("lat") is None or s.get("lon") is None:
-                continue
-            if s["category"] not in ["A3", "A4", "A5"] or (s["gs"] or 0) < 50:
-                continue
-
-            lat, lon = s["lat"], s["lon"]
-            alt = s["alt_baro"] if s["alt_baro"] != "ground" else 0
-            grad = 60 * (0 if s["baro_rate"] is None else s["baro_rate"]) / (s["gs"] or 1)
-
-            # Compute distances (squared) in nautical miles
-            d_cos_sq = distance_sq_nm(lat, lon, cos_lat, cos_lon)
-            d_den_sq = distance_sq_nm(lat, lon, den_lat, den_lon)
-            in_cos_range = d_cos_sq < (25 / 60) ** 2
-            in_den_range = d_den_sq < (25 / 60) ** 2
-
-            if in_cos_range:
-                outlier = self.model_COS.predict([[lat, lon, alt, grad]])[0]
-                color = "red" if outlier else "blue"
-            elif in_den_range:
-                outlier = self.model_DEN.predict([[lat, lon, alt, grad]])[0]
-                color = "red" if outlier else "blue"
-            else:
-                outlier = False
-                color = "gray"
-
-            states.append([lat, lon])
-            colors.append(color)
-            valid_aircraft.append({
-                "lat": lat,
-                "lon": lon,
-                "alt": alt,
-                "grad": grad,
-                "icao": s["hex"],
-                "outlier": outlier,
-                "color": color
-            })
-
-
-        if states:
-            xs = [lon for _, lon in states]
-            ys = [lat for lat, _ in states]
-            self.ax.scatter(xs, ys, c=colors)
-            self.flights = valid_aircraft
-        else:
-            self.flights = []
+        for name, lat, lon, model in self.fleet.regions:
+            self.ax.plot(lon, lat, marker='s', color='green' if model is not None else 'gray', markersize=6)
+            self.ax.text(lon + 0.2, lat, name, fontsize=9, color='green' if model is not None else 'gray')
 
         # Legend using dot markers
         from matplotlib.lines import Line2D
@@ -163,24 +204,97 @@ class FlightMap(QWidget):
         self.ax.set_xlabel("Longitude")
         self.ax.set_ylabel("Latitude")
 
+        # Updated in place every refresh; animated artists are left out of the cached background
+        self.scatter = self.ax.scatter(np.empty(0), np.empty(0), animated=self.blit, zorder=3)
+        self.tooltip = self.ax.annotate(
+            "", xy=(0, 0), xytext=(10, 10), textcoords="offset points", fontsize=8,
+            bbox=dict(boxstyle="round", fc="lightyellow", alpha=0.9), visible=False, animated=self.blit
+        )
+        self.background = None
         self.canvas.draw()
 
-    def on_click(self, event):
-        if not self.flights or event.xdata is None or event.ydata is None:
+    def on_draw(self, event):
+        """Recaptures the background after a full draw, e.g. on resize, zoom or pan"""
+        if not self.blit:
             return
+        self.background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self.draw_flights()
+
+    def draw_flights(self):
+        """Draws the flight artists onto the canvas renderer"""
+        self.ax.draw_artist(self.scatter)
+        self.ax.draw_artist(self.tooltip)
+
+    def redraw(self):
+        """Shows changes to the flight artists"""
+        if not self.blit:
+            self.canvas.draw_idle()
+        elif self.background is None:
+            self.canvas.draw()
+        else:
+            self.canvas.restore_region(self.background)
+            self.draw_flights()
+            self.canvas.blit(self.fig.bbox)
 
-        click_lon, click_lat = event.xdata, event.ydata
-        min_dist = float("inf")
-        closest = None
+    @metrics.timed("render")
+    def update_map(self):
+        # Only the newest frame is drawn, frames finished while the GUI was busy have been dropped
+        frame = self.worker.take()
+        if frame is None:
+            return
+        features, result, tracks = frame.features, frame.result, frame.tracks
+        codes = np.where(result.region < 0, 2, result.labels)
+        colors = np.array(["blue", "red", "gray"])[codes]
+
+        self.scatter.set_offsets(np.column_stack([features.lon, features.lat]))
+        self.scatter.set_facecolor(self.palette[codes])
+        self.scatter.set_edgecolor(self.palette[codes])
+        self.flights = [
+            {"lat": lat, "lon": lon, "alt": alt, "grad": grad, "icao": icao, "outlier": bool(label),
+             "score": score, "color": color, "smoothed": smoothed, "deviation": deviation}
+            for lat, lon, alt, grad, icao, label, score, color, smoothed, deviation in zip(
+                features.lat.tolist(), features.lon.tolist(), features.alt.tolist(), features.grad.tolist(),
+                features.hex.tolist(), result.labels.tolist(), result.scores.tolist(), colors.tolist(),
+                tracks.grad.tolist(), tracks.deviation.tolist())
+        ]
+        # Rebuilt once per refresh so clicks and hovers only look at nearby flights
+        self.index = GridIndex(features.lat, features.lon, cell=0.25)
+        self.hovered = None
+        self.tooltip.set_visible(False)
+        self.redraw()
+
+    def pick_radius(self, pixels=10):
+        """Distance in nautical miles covered by a number of pixels at the current zoom"""
+        lat_min, lat_max = self.ax.get_ylim()
+        return pixels * 60 * (lat_max - lat_min) / max(self.ax.bbox.height, 1)
+
+    def nearest(self, event, radius=math.inf):
+        """Finds the plotted flight closest to a mouse event, or None"""
+        if not self.flights or self.index is None or event.inaxes is not self.ax:
+            return None
+        index, _ = self.index.nearest(event.ydata, event.xdata, radius)
+        return None if index is None else self.flights[index]
+
+    def on_hover(self, event):
+        closest = self.nearest(event, self.pick_radius())
+        if closest is self.hovered:
+            return
+        self.hovered = closest
+        if closest is None:
+            self.tooltip.set_visible(False)
+        else:
+            self.tooltip.xy = (closest["lon"], closest["lat"])
+            self.tooltip.set_text(
+                f"{closest['icao']}\n{closest['alt']} ft\n"
+                f"{'Anomalous' if closest['outlier'] else 'Nominal'}"
+            )
+            self.tooltip.set_visible(True)
+        self.redraw()
 
-        # Determine closest flight to click
-        for flight in self.flights:
-            dx = flight["lat"] - click_lat
-            dy = flight["lon"] - click_lon
-            dist = dx ** 2 + dy ** 2
-            if dist < min_dist:
-                min_dist = dist
-                closest = flight
+    def on_click(self, event):
+        closest = self.nearest(event)
+        if closest is None:
+            return
 
         # Determine altitude and gradient comparison depending on click point
         # if closest:
@@ -207,20 +321,27 @@ class FlightMap(QWidget):
             f"Lat: {closest['lat']:.4f}, Lon: {closest['lon']:.4f}\n"
             f"Altitude: {closest['alt']} ft\n"
             f"Descent Gradient: {closest['grad']:.2f}\n"
+            f"Smoothed Gradient: {closest['smoothed']:.2f}, Track Deviation: {closest['deviation']:.2f} nm\n"
             #f"{extra_info}"
         )
         self.label.setText(info)
 
 class MainWindow(QMainWindow):
-    def __init__(self):
+    def __init__(self, source=None):
         super().__init__()
         self.setWindowTitle("Flight Tracker")
         self.setGeometry(100, 100, 900, 700)
-        self.flight_map = FlightMap(self)
+        self.flight_map = FlightMap(self, source=source)
         self.setCentralWidget(self.flight_map)
 
+    def closeEvent(self, event):
+        self.flight_map.stop()
+        super().closeEvent(event)
+
 if __name__ == "__main__":
     app = QApplication(sys.argv)
-    window = MainWindow()
+    # mapGUI.py traffic.cap replays a recorded capture in real time instead of pulling live snapshots
+    source = Replay(sys.argv[1], speed=1, loop=True) if len(sys.argv) > 1 else None
+    window = MainWindow(source)
     window.show()
     sys.exit(app.exec_())
@@ -0,0 +1,192 @@
+"""metrics.py instruments the snapshot pipeline with timers, counters and gauges.
+Metrics are reported to a sink: a Registry keeps them in process, a PrometheusFile also writes them in the Prometheus
+text format, e.g. for the node exporter's textfile collector. Until a sink is configured every call returns at once,
+so instrumented code costs next to nothing. Setting ADSB_METRICS to a file name writes the metrics there from startup."""
+
+from classes import DotDict
+from collections import deque
+import functools
+import os
+import threading
+import time
+
+
+class Registry:
+    """Keeps the metrics in process"""
+
+    def __init__(self, history: int = 1000) -> None:
+        """
+        @history: Number of recent durations kept per timer for its percentiles.
+        """
+        self.history = history
+        self.counters = {}
+        "Total of each counter"
+        self.gauges = {}
+        "Last value of each gauge"
+        self.timers = {}
+        "Count, sum in seconds and recent durations of each timer"
+        self.lock = threading.Lock()
+
+    def count(self, name: str, value: float = 1) -> None:
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def gauge(self, name: str, value: float) -> None:
+        with self.lock:
+            self.gauges[name] = value
+
+    def observe(self, name: str, seconds: float) -> None:
+        with self.lock:
+            timer = self.timers.get(name)
+            if timer is None:
+                timer = self.timers[name] = DotDict(count=0, sum=0.0, recent=deque(maxlen=self.history))
+            timer.count += 1
+            timer.sum += seconds
+            timer.recent.append(seconds)
+
+    def summary(self) -> DotDict:
+        """Summarizes every metric, with the p50, p90 and p99 of the recent durations of each timer"""
+        with self.lock:
+            timers = {name: (timer.count, timer.sum, sorted(timer.recent)) for name, timer in self.timers.items()}
+            summary = DotDict(counters=dict(self.counters), gauges=dict(self.gauges), timers={})
+        for name, (count, total, recent) in timers.items():
+            timer = summary.timers[name] = DotDict(count=count, sum=total)
+            for label, q in (("p50", 0.5), ("p90", 0.9), ("p99", 0.99)):
+                timer[label] = recent[min(int(q * len(recent)), len(recent) - 1)] if recent else None
+        return summary
+
+
+class PrometheusFile(Registry):
+    """Keeps the metrics in process and regularly writes them to a file in the Prometheus text format.
+    Counters are written as adsb_<name>_total, gauges as adsb_<name> and timers as adsb_<name>_seconds summaries."""
+
+    def __init__(self, filename: str, interval: float = 15, history: int = 1000) -> None:
+        """
+        @filename: The written file, replaced atomically so scrapers never read a partial file.
+        @interval: Minimum time between writes in seconds; the file is written by whichever thread reports a metric.
+        """
+        super().__init__(history)
+        self.filename = filename
+        self.interval = interval
+        self.written = 0.0
+        "Monotonic time of the last write"
+        self.__writing = threading.Lock()
+
+    def count(self, name: str, value: float = 1) -> None:
+        super().count(name, value)
+        self.__due()
+
+    def gauge(self, name: str, value: float) -> None:
+        super().gauge(name, value)
+        self.__due()
+
+    def observe(self, name: str, seconds: float) -> None:
+        super().observe(name, seconds)
+        self.__due()
+
+    def __due(self) -> None:
+        # A thread finding another one writing leaves it to that one
+        if time.monotonic() - self.written >= self.interval and self.__writing.acquire(blocking=False):
+            try:
+                self.write()
+            finally:
+                self.__writing.release()
+
+    def write(self) -> None:
+        """Writes the metrics now"""
+        self.written = time.monotonic()
+        summary = self.summary()
+        lines = []
+        for name, value in sorted(summary.counters.items()):
+            lines += [f"# TYPE adsb_{name}_total counter", f"adsb_{name}_total {value}"]
+        for name, value in sorted(summary.gauges.items()):
+            lines += [f"# TYPE adsb_{name} gauge", f"adsb_{name} {value}"]
+        for name, timer in sorted(summary.timers.items()):
+            lines.append(f"# TYPE adsb_{name}_seconds summary")
+            for label, q in (("p50", "0.5"), ("p90", "0.9"), ("p99", "0.99")):
+                if timer[label] is not None:
+                    lines.append(f'adsb_{name}_seconds{{quantile="{q}"}} {timer[label]}')
+            lines += [f"adsb_{name}_seconds_sum {timer.sum}", f"adsb_{name}_seconds_count {timer.count}"]
+        with open(self.filename + ".tmp", "w") as file:
+            file.write("\n".join(lines) + "\n")
+        os.replace(self.filename + ".tmp", self.filename)
+
+
+sink = None
+"""Sink receiving the metrics, None while disabled"""
+
+
+def configure(new_sink) -> None:
+    """Reports the metrics to a Registry or PrometheusFile from now on, or disables them with None"""
+    global sink
+    sink = new_sink
+
+
+def count(name: str, value: float = 1) -> None:
+    """Adds to a counter, such as bytes received or frames dropped"""
+    if sink is not None:
+        sink.count(name, value)
+
+
+def gauge(name: str, value: float) -> None:
+    """Sets a gauge, such as the depth of a queue"""
+    if sink is not None:
+        sink.gauge(name, value)
+
+
+def observe(name: str, seconds: float) -> None:
+    """Records a duration of a timer"""
+    if sink is not None:
+        sink.observe(name, seconds)
+
+
+class Timer:
+    """Times the block of a with statement"""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *args) -> None:
+        observe(self.name, time.perf_counter() - self.start)
+
+
+class __Idle:
+    """Stands in for a Timer while the metrics are disabled"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        pass
+
+
+__idle = __Idle()
+
+
+def timer(name: str):
+    """Times the block of a with statement: with metrics.timer("decode"): ..."""
+    return __idle if sink is None else Timer(name)
+
+
+def timed(name: str):
+    """Decorates a function so every call is timed under a name"""
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if sink is None:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                observe(name, time.perf_counter() - start)
+        return wrapper
+    return decorate
+
+
+if 'ADSB_METRICS' in os.environ:
+    configure(PrometheusFile(os.environ['ADSB_METRICS']))
@@ -0,0 +1,173 @@
+"""models.py trains the anomaly models on harvested airport frames and keeps them in the cache directory.
+A model is stored with its feature schema, its parameters and a hash of its training data, and is only retrained
+when one of them changes, so every launch scores with the same model."""
+
+from scoring import RegionScorer, feature_names
+from utils import cache_path, data, find_airports
+from framestore import FrameStore
+import hashlib
+import os
+import pickle
+import time
+import numpy as np
+
+version = 2
+"Bumped whenever the pickled layout changes"
+
+csv_directory = data
+"""Directory of the <ident>.csv frames written by earlier versions of project.py, the repository root by default"""
+
+defaults = dict(contamination=0.01, max_samples="auto", random_state=42)
+"""IForest parameters used unless overridden; the fixed seed makes retraining reproducible"""
+
+
+class TrainedModel:
+    """A fitted anomaly model and what it was trained on"""
+
+    def __init__(self, estimator, params: dict, digest: str, samples: int, signature: tuple) -> None:
+        self.estimator = estimator
+        "The fitted pyod model"
+        self.params = params
+        "Parameters of the model, including the altitude cutoff"
+        self.features = list(feature_names)
+        "Columns of the feature matrix the model expects"
+        self.digest = digest
+        "SHA-256 of the training data"
+        self.samples = samples
+        "Number of frames the model was trained on"
+        self.signature = signature
+        "Cheap fingerprint of the training data source, such as a file's size and modification time"
+        self.version = version
+        self.trained = time.time()
+        "Time of training in seconds since the epoch"
+
+    def __repr__(self) -> str:
+        return f"TrainedModel({self.samples} samples, {self.digest[:12]}, {self.params})"
+
+
+def read_frames(filename: str, max_alt: float = None) -> np.ndarray:
+    """Reads the frames of an airport CSV as a feature matrix.
+    @max_alt: If given, frames at or above this altitude are left out.
+    Incomplete rows are dropped.
+    """
+    import pandas as pd
+    frames = pd.read_csv(filename, header=None, usecols=range(len(feature_names))).dropna().to_numpy(np.float64)
+    if max_alt is not None:
+        frames = frames[frames[:, feature_names.index("alt")] < max_alt]
+    return frames
+
+
+def fit(x: np.ndarray, **params):
+    """Fits an IForest to a feature matrix.
+    @params: IForest parameters overriding defaults.
+    """
+    from pyod.models.iforest import IForest
+    estimator = IForest(**{**defaults, **params})
+    estimator.fit(x)
+    return estimator
+
+
+def load(filename: str, max_alt: float = None, **params) -> TrainedModel:
+    """Loads the model of an airport CSV from the cache, training and storing it if the data or parameters changed.
+    @max_alt: If given, frames at or above this altitude are left out.
+    @params: IForest parameters overriding defaults.
+    """
+    def digest():
+        with open(filename, "rb") as file:
+            return hashlib.sha256(file.read()).hexdigest()
+
+    stat = os.stat(filename)
+    return __cached(os.path.abspath(filename), (stat.st_size, stat.st_mtime_ns), digest,
+                    lambda: read_frames(filename, max_alt), max_alt, params)
+
+
+def load_airport(store: FrameStore, airport: str, max_alt: float = None, **params) -> TrainedModel:
+    """Loads the model of an airport's frames in a FrameStore, training and storing it if the frames or parameters changed.
+    @max_alt: If given, frames at or above this altitude are left out.
+    @params: IForest parameters overriding defaults.
+    """
+    x = None
+
+    def features():
+        nonlocal x
+        if x is None:
+            x = store.features(airport, max_alt)
+        return x
+
+    # Chunks are never rewritten, so the same chunk names mean the same frames
+    signature = tuple(os.path.basename(name) for name, start, end in store.chunks())
+    return __cached((os.path.abspath(store.directory), airport), signature,
+                    lambda: hashlib.sha256(features().tobytes()).hexdigest(), features, max_alt, params)
+
+
+def __cached(source, signature: tuple, digest, features, max_alt: float, params: dict) -> TrainedModel:
+    """Loads a model from the cache, or trains and stores it.
+    @source: Identifies the training data.
+    @signature: Cheap fingerprint of the training data; when it changed, the data is hashed to decide on retraining.
+    @digest: Returns the SHA-256 of the training data.
+    @features: Returns the feature matrix to train on.
+    """
+    wanted = {**defaults, **params, "max_alt": max_alt}
+    key = repr((source, sorted(wanted.items(), key=lambda item: item[0])))
+    cached = cache_path(f"model-{hashlib.sha256(key.encode()).hexdigest()[:16]}.pickle")
+
+    model = None
+    try:
+        with open(cached, "rb") as file:
+            model = pickle.load(file)
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, AttributeError, ImportError):
+        pass
+
+    if model is not None and model.version == version and model.features == feature_names and model.params == wanted:
+        if model.signature == signature:
+            return model
+        # The source changed on the surface, only retrain if the data did
+        data_digest = digest()
+        if data_digest == model.digest:
+            model.signature = signature
+            __store(model, cached)
+            return model
+    else:
+        data_digest = digest()
+
+    x = features()
+    model = TrainedModel(fit(x, **params), wanted, data_digest, len(x), signature)
+    __store(model, cached)
+    return model
+
+
+def __store(model: TrainedModel, cached: str) -> None:
+    """Pickles a model, replacing the cached copy atomically"""
+    tmp = cached + ".tmp"
+    with open(tmp, "wb") as file:
+        pickle.dump(model, file, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, cached)
+
+
+class ModelFleet(RegionScorer):
+    """A RegionScorer with one model per monitored airport, trained on the airport's harvested frames"""
+
+    def __init__(self, idents: list = None, radius: float = 25, store: FrameStore = None, directory: str = csv_directory,
+                 **params) -> None:
+        """
+        @idents: ICAO idents of the airports, the ones listed in airports.txt by default.
+        @radius: Radius of each airport's region in nautical miles.
+        @store: FrameStore with the harvested frames, the default store by default.
+        @directory: Directory of the <ident>.csv files used for airports without frames in the store.
+        @params: Parameters of the models, see load.
+        Airports without frames are kept as unmonitored regions.
+        """
+        store = store if store is not None else FrameStore()
+        stored = set(store.airports())
+        self.models = {}
+        "Loaded model of each airport ident"
+        regions = []
+        for ident, lat, lon in find_airports(idents or []):
+            filename = os.path.join(directory, ident + ".csv")
+            if ident in stored:
+                self.models[ident] = load_airport(store, ident, **params)
+            elif os.path.exists(filename):
+                self.models[ident] = load(filename, **params)
+            model = self.models.get(ident)
+            regions.append((ident, lat, lon, None if model is None else model.estimator))
+        super().__init__(regions, radius)
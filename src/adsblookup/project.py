@@ -1,7 +1,15 @@
 #!/usr/bin/python3
 
 from bincraft import *
-from utils import find_airports
+from utils import find_airports, bounding_box
+from scoring import heavy, near, trace_features
+from framestore import FrameStore, records
+import fetch
+import metrics
+import requests
+import asyncio
+import concurrent.futures
+import time
 import os
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
@@ -9,49 +17,46 @@ import matplotlib.animation as animation
 path = os.environ['FLIGHTS_PATH'] if 'FLIGHTS_PATH' in os.environ else ""
 
 
-def pull_trace_raw(icao: str, recent: bool = False, verbose=False):
+def pull_trace_raw(icao: str, recent: bool = False, verbose=False, source=None):
     """Pull raw JSON data from adsbexchange.com.
     @icao: The 6 digit hex code representing the aircraft's ICAO identifier.
     @recent: If True, retrieves only the last 1-2 hours of trace data (less data over the wire)
     @verbose: If True, print errors for debugging.
+    @source: Where the trace comes from, fetch.live by default. Pass a capture.Replay to read recorded traces.
     """
-    headers = {
-        'referer': 'https://globe.adsbexchange.com',
-    }
     icao = icao.lower()
-
-    # ADSB provides trace data for individual aircraft in the following scheme
-    # We can choose to pull the full trace (up to 25 hours of history) with "trace_full_{icao}.json"
-    #   or the last hour
-    # URL subdirectory uses last 2 characters of icao
-    url_full = f'https://globe.adsbexchange.com/data/traces/{icao[-2:]}/trace_full_{icao}.json'
-    url_recent = f'https://globe.adsbexchange.com/data/traces/{icao[-2:]}/trace_recent_{icao}.json'
-    url = url_recent if recent else url_full
-    response = requests.get(url, headers=headers)
-    if response.status_code >= 400:
-        if verbose: print(f"Received bad status code {response.status_code}.")
+    source = source if source is not None else fetch.live
+    try:
+        response = source.trace(icao, recent)
+    except requests.RequestException as e:
+        if verbose: print(f"Failed to reach adsbexchange.com for icao hex {icao}: {e}")
+        return None
+    if response.status >= 400:
+        if verbose: print(f"Received bad status code {response.status}.")
         return None
 
     try:
-        return response.json()
+        return json.loads(response.content)
     except json.JSONDecodeError:
         if verbose: print(
-            f"Failed to get JSON data from adsbexchange.com for icao hex {icao}: [{response.status_code}] {response.content}")
+            f"Failed to get JSON data from adsbexchange.com for icao hex {icao}: [{response.status}] {response.content}")
         return None
 
 
-def pull_trace(icao: str, recent: bool = False):
+def pull_trace(icao: str, recent: bool = False, source=None):
     """Pull and parse JSON data from adsbexchange.com
     @icao: The 6 digit hex code representing the aircraft's ICAO identifier.
     @recent: If True, retrieves only the last 1-2 hours of trace data (less data over the wire)
+    @source: Where the trace comes from, see pull_trace_raw.
     """
-    raw = pull_trace_raw(icao)
+    raw = pull_trace_raw(icao, recent, source=source)
     if raw is None:
         return None
     return AdsbTrace(raw)
 
 
 def extract(trace):
+    """Extracts [lat, lon, alt, grad] frames from a parsed trace, see scoring.trace_features for raw traces"""
     extracted = []
     for state in trace.states:
         try:
@@ -70,39 +75,162 @@ def filter(aclat, aclon, tlat, tlon, threshold):
     return ds < ((threshold / 60) ** 2)
 
 
-def update(tlat, tlon, output):
-    a = pull_snapshot()
-    thresh = 25
-    downsampling = 20
-    acs = [
-        ac.hex for ac in a.aircraft
-        if filter(ac.lat, ac.lon, tlat, tlon, thresh) and ac.hex is not None and ac.category in ['A3', 'A4', 'A5']
-    ]
-    frames = []
-    for ac in acs:
-        frames += [
-            frame for frame in extract(pull_trace(ac, recent=True))
-            if filter(frame[0], frame[1], tlat, tlon, thresh)
-        ][::downsampling]
-    if len(frames) == 0:
+thresh = 25
+"""Radius around an airport in nautical miles within which aircraft are harvested"""
+
+
+downsampling = 20
+"""Only every n-th frame of a trace near an airport is kept"""
+
+
+class RateLimiter:
+    """Token bucket limiting the rate of requests sent to a single host"""
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        """
+        @rate: Number of requests allowed per second.
+        @burst: Number of requests that can be sent at once after a pause.
+        """
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.last = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Waits until a request may be sent"""
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.last) * self.rate)
+                self.last = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class Harvester:
+    """Pulls the traces of the heavy aircraft around several airports concurrently.
+    Each aircraft's trace is fetched once, and its frames near each airport are appended to the frame store as soon as it arrives."""
+
+    def __init__(self, concurrency: int = 16, rate: float = 20.0, burst: int = 5, recent: bool = True,
+                 store: FrameStore = None, source=None) -> None:
+        """
+        @concurrency: Maximum number of traces fetched at once.
+        @rate: Maximum number of trace requests per second sent to each host.
+        @burst: Number of requests a host may receive at once after a pause.
+        @recent: If True, pulls only the last 1-2 hours of each trace instead of the full 25 hours.
+        @store: FrameStore receiving the frames, the default store by default.
+        @source: Where the traces come from, fetch.live by default; see fetch.LiveSource.
+        """
+        self.store = store if store is not None else FrameStore()
+        self.source = source if source is not None else fetch.live
+        self.concurrency = concurrency
+        self.rate = rate
+        self.burst = burst
+        self.recent = recent
+        self.failed = []
+        "Hexes whose trace could not be pulled or processed in the last harvest"
+        self.__limiters = {}
+
+    def run(self, airports: list, snapshots: list) -> dict:
+        """Harvests frames around every airport.
+        @airports: The airports as (name, lat, lon).
+        @snapshots: One snapshot covering the surroundings of each airport.
+        Returns the number of frames written per airport name. Aircraft whose trace failed are listed in failed.
+        """
+        return asyncio.run(self.harvest(airports, snapshots))
+
+    async def harvest(self, airports: list, snapshots: list) -> dict:
+        """Coroutine version of run"""
+        # Route each aircraft to every airport it is close to, so its trace is pulled once
+        targets = {}
+        for (name, lat, lon), snapshot in zip(airports, snapshots):
+            for ac in snapshot.aircraft:
+                if ac.hex is not None and ac.category in heavy and filter(ac.lat, ac.lon, lat, lon, thresh):
+                    targets.setdefault(ac.hex, []).append((name, lat, lon))
+
+        # Limiters are bound to the running event loop
+        self.__limiters = {}
+        self.failed = []
+        counts = {name: 0 for name, lat, lon in airports}
+        pending = len(targets)
+        metrics.gauge("pending_traces", pending)
+        semaphore = asyncio.Semaphore(self.concurrency)
+        loop = asyncio.get_running_loop()
+        try:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+                async def one(icao, close):
+                    nonlocal pending
+                    try:
+                        async with semaphore:
+                            # Replayed traces are not sent anywhere, so they are not rate limited
+                            if self.source.host is not None:
+                                await self.__limiter(self.source.host).acquire()
+                            frames = await loop.run_in_executor(executor, self.__frames, icao, close)
+                        for name, rows in frames.items():
+                            self.store.append(rows)
+                            counts[name] += len(rows)
+                            metrics.count("harvested_frames", len(rows))
+                    except Exception:
+                        # One bad trace must not lose the others
+                        self.failed.append(icao)
+                        metrics.count("trace_failures")
+                    finally:
+                        pending -= 1
+                        metrics.gauge("pending_traces", pending)
+
+                await asyncio.gather(*[one(icao, close) for icao, close in targets.items()])
+        finally:
+            self.store.flush()
+        return counts
+
+    def __limiter(self, host: str) -> RateLimiter:
+        """Returns the rate limiter of a host"""
+        if host not in self.__limiters:
+            self.__limiters[host] = RateLimiter(self.rate, self.burst)
+        return self.__limiters[host]
+
+    def __frames(self, icao: str, airports: list) -> dict:
+        """Pulls a trace and extracts its downsampled frames near each airport"""
+        raw = pull_trace_raw(icao, recent=self.recent, source=self.source)
+        if raw is None:
+            self.failed.append(icao)
+            metrics.count("trace_failures")
+            return {}
+        features = trace_features(raw)
+        frames = {}
+        for name, lat, lon in airports:
+            rows = near(features.lat, features.lon, lat, lon, thresh, downsampling)
+            frames[name] = records(icao, features.time[rows], features.lat[rows], features.lon[rows],
+                                   features.alt[rows], features.grad[rows], name)
+        return frames
+
+
+def update(tlat, tlon, output, snapshot=None, source=None):
+    """Appends frames from the heavy aircraft around an airport to the frame store.
+    @snapshot: Snapshot covering the airport, pulled for its surroundings if not given.
+    @source: Where the snapshot and traces come from, see fetch.LiveSource.
+    """
+    a = snapshot if snapshot is not None else pull_snapshot(bounding_box(tlat, tlon, thresh), columnar=True, source=source)
+    count = Harvester(source=source).run([(output, tlat, tlon)], [a])[output]
+    if count == 0:
         print("Not enough data")
         return
-    file = open(path + output + ".csv", "a")
-    for frame in frames:
-        for item in frame:
-            file.write(str(item) + ",")
-        file.write("\n")
-    file.close()
-    print(output + " updated with " + str(len(frames)) + " frames...")
-
-
-
-
+    print(output + " updated with " + str(count) + " frames...")
 
 
 if __name__ == '__main__':
-    for name, lat, long in find_airports():
-        update(lat, long, name)
+    airports = find_airports()
+    # One request serves every airport's surroundings
+    snapshots = pull_snapshots([bounding_box(lat, long, thresh) for name, lat, long in airports], columnar=True)
+    harvester = Harvester()
+    counts = harvester.run(airports, snapshots)
+    for name, count in counts.items():
+        print(name + " updated with " + str(count) + " frames...")
+    if harvester.failed:
+        print(str(len(harvester.failed)) + " traces failed")
 
 
     """
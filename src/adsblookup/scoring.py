@@ -0,0 +1,142 @@
+"""scoring.py extracts anomaly features from snapshots and scores them in batches.
+Features are built for every aircraft at once from the snapshot columns, and each airport region's model
+scores all of its aircraft in a single call."""
+
+from classes import DotDict
+from spatial import GridIndex, distance_nm
+import metrics
+import numpy as np
+
+feature_names = ["lat", "lon", "alt", "grad"]
+"""Columns of the feature matrix, in the order the models are trained on"""
+
+heavy = ['A3', 'A4', 'A5']
+"""Emitter categories of the aircraft that are monitored"""
+
+
+def features(lat, lon, alt, rate, gs) -> np.ndarray:
+    """Builds the feature matrix of aircraft states, with the columns of feature_names.
+    @rate: Climb rates in feet per minute.
+    @gs: Ground speeds in knots; the gradient is not finite where it is 0 or missing.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        grad = 60 * np.asarray(rate, dtype=np.float64) / gs
+    return np.column_stack([lat, lon, alt, grad])
+
+
+@metrics.timed("features")
+def snapshot_features(snapshot, categories: list = heavy, min_speed: float = 50) -> DotDict:
+    """Extracts the features of the monitored aircraft of a columnar snapshot.
+    @snapshot: An AdsbColumnarSnapshot.
+    @categories: Emitter categories to keep.
+    @min_speed: Minimum ground speed in knots, slower aircraft are taxiing or parked.
+    Returns a DotDict of arrays with one row per kept aircraft: hex, lat, lon, alt, grad,
+    and X, the feature matrix with the columns of feature_names.
+    """
+    columns = snapshot.columns
+    lat = columns["lat"]
+    lon = columns["lon"]
+    gs = columns["gs"]
+    keep = np.isin(columns["category"], categories) & (np.nan_to_num(gs) >= min_speed)
+    keep &= np.isfinite(lat) & np.isfinite(lon)
+
+    # Aircraft on the ground are at altitude 0, a missing climb rate counts as level flight
+    alt = np.where(columns["airground"][keep] == 1, 0, columns["alt_baro"][keep])
+    X = features(lat[keep], lon[keep], alt, np.nan_to_num(columns["baro_rate"][keep]), gs[keep])
+    return DotDict(hex=columns["hex"][keep], lat=X[:, 0], lon=X[:, 1], alt=X[:, 2], grad=X[:, 3], X=X)
+
+
+@metrics.timed("trace_features")
+def trace_features(raw: dict) -> DotDict:
+    """Extracts the features of the airborne states of a raw trace, as returned by project.pull_trace_raw.
+    States on the ground or missing a position, altitude, climb rate or ground speed are dropped.
+    Returns a DotDict with the aircraft's icao and arrays with one row per kept state: time (Unix epoch seconds),
+    lat, lon, alt, grad, and X, the feature matrix with the columns of feature_names.
+    """
+    trace = raw.get("trace") or []
+    if len(trace) == 0:
+        return DotDict(icao=raw.get("icao"), time=np.empty(0), lat=np.empty(0), lon=np.empty(0), alt=np.empty(0),
+                       grad=np.empty(0), X=np.empty((0, len(feature_names))))
+
+    # Trace states are [timedelta, lat, lon, alt, gs, track, flags, baro_rate, ...], with None for missing values
+    columns = np.array([state[:8] if len(state) >= 8 else list(state) + [None] * (8 - len(state)) for state in trace],
+                       dtype=object)
+    columns[columns[:, 3] == "ground", 3] = None
+    numbers = np.where(columns == None, np.nan, columns).astype(np.float64)
+
+    X = features(numbers[:, 1], numbers[:, 2], numbers[:, 3], numbers[:, 7], numbers[:, 4])
+    keep = np.isfinite(X).all(axis=1)
+    X = X[keep]
+    return DotDict(icao=raw.get("icao"), time=(raw.get("timestamp") or 0) + numbers[keep, 0], lat=X[:, 0], lon=X[:, 1],
+                   alt=X[:, 2], grad=X[:, 3], X=X)
+
+
+def near(lat, lon, tlat: float, tlon: float, radius: float, downsampling: int = 1) -> np.ndarray:
+    """Finds the rows whose positions are within a radius of a target, keeping every n-th.
+    @radius: The radius in nautical miles.
+    @downsampling: Only every n-th row within the radius is kept.
+    Returns the indices of the kept rows.
+    """
+    return np.flatnonzero(distance_nm(lat, lon, tlat, tlon) < radius)[::downsampling]
+
+
+def score(model, X) -> tuple:
+    """Scores a feature matrix with a fitted pyod model in one batched call.
+    Returns the decision scores and the outlier labels (1 for outliers) of the rows.
+    """
+    if len(X) == 0:
+        return np.empty(0), np.empty(0, dtype=int)
+    scores = model.decision_function(X)
+    # pyod's predict thresholds the same decision scores, this avoids scoring twice
+    return scores, (scores > model.threshold_).astype(int)
+
+
+class RegionScorer:
+    """Scores aircraft with one model per airport region.
+    An aircraft belongs to the region of the closest airport within the radius. Aircraft are routed to airports
+    through a spatial index of the airports, so hundreds of regions cost no more per aircraft than a few."""
+
+    def __init__(self, regions: list, radius: float = 25) -> None:
+        """
+        @regions: The regions as (name, lat, lon, model). Regions without a model are left unmonitored.
+        @radius: Radius of each region in nautical miles.
+        """
+        self.regions = regions
+        self.radius = radius
+        self.grid = GridIndex([lat for name, lat, lon, model in regions], [lon for name, lat, lon, model in regions])
+
+    def route(self, lat, lon) -> np.ndarray:
+        """Finds the region of each position.
+        Returns the index into regions of the closest airport within the radius, or -1 when there is none.
+        """
+        region = np.full(len(lat), -1)
+        aircraft, airports, distances = self.grid.pairs(lat, lon, self.radius)
+        # Sorted by aircraft then distance, the first pair of every aircraft is its closest airport
+        order = np.lexsort((distances, aircraft))
+        first = np.unique(aircraft[order], return_index=True)[1]
+        region[aircraft[order][first]] = airports[order][first]
+        return region
+
+    @metrics.timed("score")
+    def score(self, features: DotDict) -> DotDict:
+        """Scores the aircraft of snapshot_features.
+        Returns a DotDict of arrays aligned with the feature rows: region (index into regions, -1 when
+        outside every region), scores (NaN when unscored) and labels (1 for outliers).
+        """
+        count = len(features.X)
+        region = self.route(features.lat, features.lon)
+        # Aircraft with a missing altitude, or in a region without a model, cannot be scored and stay unmonitored
+        region[~np.isfinite(features.X).all(axis=1)] = -1
+        region[np.isin(region, [i for i, (name, lat, lon, model) in enumerate(self.regions) if model is None])] = -1
+
+        scores = np.full(count, np.nan)
+        labels = np.zeros(count, dtype=int)
+        # One batch per region that has aircraft
+        rows = np.flatnonzero(region >= 0)
+        rows = rows[np.argsort(region[rows], kind="stable")]
+        names, starts = np.unique(region[rows], return_index=True)
+        for i, group in zip(names.tolist(), np.split(rows, starts[1:])):
+            scores[group], labels[group] = score(self.regions[i][3], features.X[group])
+        metrics.count("scored_aircraft", len(rows))
+        metrics.count("anomalies", int(labels.sum()))
+        return DotDict(region=region, scores=scores, labels=labels)
@@ -0,0 +1,129 @@
+"""spatial.py indexes positions on the globe for radius and nearest-neighbor queries.
+Points are bucketed into fixed-size latitude/longitude cells, so a query only measures the points in the cells it overlaps."""
+
+import math
+import numpy as np
+
+
+def distance_nm(lat1, lon1, lat2, lon2):
+    """Equirectangular distance in nautical miles between positions in decimal degrees.
+    Accurate over the short ranges used around airports, and works elementwise on arrays."""
+    dlon = (np.subtract(lon1, lon2) + 180) % 360 - 180
+    latr = np.radians(np.add(lat1, lat2) / 2)
+    return 60 * np.sqrt(np.subtract(lat1, lat2) ** 2 + (dlon * np.cos(latr)) ** 2)
+
+
+class GridIndex:
+    """Buckets points into fixed-size latitude/longitude cells.
+    Points without a position (NaN) are left out of the index."""
+
+    def __init__(self, lat, lon, cell: float = 1.0) -> None:
+        """
+        @lat: Latitudes of the points in decimal degrees.
+        @lon: Longitudes of the points in decimal degrees.
+        @cell: Size of a cell in degrees. Cells around the query radius keep queries cheapest.
+        """
+        self.lat = np.asarray(lat, dtype=np.float64)
+        self.lon = np.asarray(lon, dtype=np.float64)
+        self.cell = cell
+        self.__columns = int(math.ceil(360 / cell))
+
+        valid = np.flatnonzero(np.isfinite(self.lat) & np.isfinite(self.lon))
+        keys = self.__key(self.lat[valid], self.lon[valid])
+        order = np.argsort(keys, kind="stable")
+        self.__order = valid[order]
+        unique, starts, counts = np.unique(keys[order], return_index=True, return_counts=True)
+        self.__cells = {key: (start, start + count) for key, start, count in zip(unique.tolist(), starts.tolist(), counts.tolist())}
+
+    def __len__(self) -> int:
+        return len(self.__order)
+
+    def __key(self, lat, lon):
+        """Cell keys of positions"""
+        row = np.floor(np.asarray(lat) / self.cell).astype(np.int64)
+        column = np.floor((np.asarray(lon) + 180) / self.cell).astype(np.int64) % self.__columns
+        return row * self.__columns + column
+
+    def __candidates(self, lat: float, lon: float, radius: float) -> np.ndarray:
+        """Indices of the points in every cell overlapping a radius around a position"""
+        dlat = radius / 60
+        rows = range(int(math.floor((lat - dlat) / self.cell)), int(math.floor((lat + dlat) / self.cell)) + 1)
+        # Longitude degrees shrink towards the poles, so the widest row bounds the span
+        edge = min(abs(lat) + dlat, 89.9)
+        dlon = dlat / math.cos(math.radians(edge))
+        if 2 * dlon >= 360 - self.cell:
+            columns = range(self.__columns)
+        else:
+            first = int(math.floor((lon - dlon + 180) / self.cell))
+            last = int(math.floor((lon + dlon + 180) / self.cell))
+            columns = [column % self.__columns for column in range(first, last + 1)]
+
+        slices = []
+        for row in rows:
+            for column in columns:
+                bounds = self.__cells.get(row * self.__columns + column)
+                if bounds is not None:
+                    slices.append(self.__order[bounds[0]:bounds[1]])
+        return np.concatenate(slices) if slices else np.empty(0, dtype=np.int64)
+
+    def within(self, lat: float, lon: float, radius: float) -> tuple:
+        """Finds the points within a radius of a position.
+        @radius: The radius in nautical miles.
+        Returns the indices of the points and their distances, sorted by distance.
+        """
+        candidates = self.__candidates(lat, lon, radius)
+        distances = distance_nm(lat, lon, self.lat[candidates], self.lon[candidates])
+        keep = distances <= radius
+        candidates, distances = candidates[keep], distances[keep]
+        order = np.argsort(distances, kind="stable")
+        return candidates[order], distances[order]
+
+    def nearest(self, lat: float, lon: float, radius: float = math.inf) -> tuple:
+        """Finds the point closest to a position.
+        @radius: The maximum distance in nautical miles.
+        Returns the index of the point and its distance, or (None, inf) when no point is within the radius.
+        """
+        # Grow the search until it finds a point; any closer point would have been found as well
+        search = min(radius, self.cell * 60)
+        while True:
+            indices, distances = self.within(lat, lon, search)
+            if len(indices):
+                return int(indices[0]), float(distances[0])
+            if search >= radius or search > 180 * 60:
+                return None, math.inf
+            search = min(radius, search * 2)
+
+    def pairs(self, lat, lon, radius: float) -> tuple:
+        """Finds every point within a radius of each of several positions.
+        Positions sharing a cell are matched against their candidate points in one array operation.
+        @lat: Latitudes of the positions.
+        @lon: Longitudes of the positions.
+        @radius: The radius in nautical miles.
+        Returns matching arrays of position indices, point indices and distances.
+        """
+        lat = np.asarray(lat, dtype=np.float64)
+        lon = np.asarray(lon, dtype=np.float64)
+        valid = np.flatnonzero(np.isfinite(lat) & np.isfinite(lon))
+        keys = self.__key(lat[valid], lon[valid])
+        order = np.argsort(keys, kind="stable")
+        unique, starts = np.unique(keys[order], return_index=True)
+        ends = np.append(starts[1:], len(order))
+
+        queries, points, distances = [], [], []
+        for start, end in zip(starts, ends):
+            group = valid[order[start:end]]
+            # Every position in the cell is within a cell's width of its center
+            center_lat = (math.floor(lat[group[0]] / self.cell) + 0.5) * self.cell
+            center_lon = (math.floor((lon[group[0]] + 180) / self.cell) + 0.5) * self.cell - 180
+            candidates = self.__candidates(center_lat, center_lon, radius + 60 * self.cell)
+            if len(candidates) == 0:
+                continue
+            matrix = distance_nm(lat[group][:, None], lon[group][:, None], self.lat[candidates][None, :], self.lon[candidates][None, :])
+            rows, columns = np.nonzero(matrix <= radius)
+            queries.append(group[rows])
+            points.append(candidates[columns])
+            distances.append(matrix[rows, columns])
+
+        if not queries:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty(0)
+        return np.concatenate(queries), np.concatenate(points), np.concatenate(distances)
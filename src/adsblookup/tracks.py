@@ -0,0 +1,191 @@
+"""tracks.py follows aircraft across successive snapshots.
+A TrackStore keeps the recent positions of every aircraft in ring buffers, the rows of 2D arrays that are joined to
+each snapshot by hex, so features over a window of positions are computed for every aircraft at once without
+pulling their traces."""
+
+from classes import DotDict
+from spatial import distance_nm
+import numpy as np
+
+fields = ("time", "lat", "lon", "alt", "gs", "rate", "track")
+"""Values kept for every position: Unix epoch seconds, decimal degrees, feet (0 on the ground), knots,
+feet per minute and degrees"""
+
+
+class TrackStore:
+    """Ring buffers of the recent positions of aircraft, keyed by ICAO hex.
+    Positions are appended from columnar snapshots; an aircraft whose position did not change since the last snapshot
+    is not appended again, and aircraft not seen for max_age seconds are evicted and their rows reused."""
+
+    def __init__(self, depth: int = 32, max_age: float = 60, capacity: int = 1024) -> None:
+        """
+        @depth: Number of positions kept per aircraft.
+        @max_age: Seconds after the last position at which an aircraft is evicted.
+        @capacity: Number of aircraft rows allocated up front, doubled whenever they run out.
+        """
+        self.depth = depth
+        self.max_age = max_age
+        self.hexes = np.empty(0, dtype="<U7")
+        "Hexes of the tracked aircraft, sorted"
+        self.rows = np.empty(0, dtype=np.intp)
+        "Row of each tracked aircraft, aligned with hexes"
+        self.buffers = {name: np.full((capacity, depth), np.nan) for name in fields}
+        "Ring buffer arrays of each field, one row per aircraft"
+        self.head = np.zeros(capacity, dtype=np.intp)
+        "Column of each row that is written next"
+        self.length = np.zeros(capacity, dtype=np.intp)
+        "Number of positions held by each row"
+        self.seen = np.full(capacity, np.nan)
+        "Time of the last position of each row"
+        self.__free = np.arange(capacity - 1, -1, -1)
+
+    def __len__(self) -> int:
+        return len(self.hexes)
+
+    def __contains__(self, hex: str) -> bool:
+        return bool(self.lookup([hex])[0] >= 0)
+
+    def lookup(self, hexes) -> np.ndarray:
+        """Finds the rows of aircraft, -1 for the ones that are not tracked"""
+        hexes = np.asarray(hexes, dtype=self.hexes.dtype)
+        if len(self.hexes) == 0:
+            return np.full(len(hexes), -1, dtype=np.intp)
+        index = np.minimum(np.searchsorted(self.hexes, hexes), len(self.hexes) - 1)
+        return np.where(self.hexes[index] == hexes, self.rows[index], -1)
+
+    def update(self, snapshot, now: float = None) -> DotDict:
+        """Appends the positions of a columnar snapshot and evicts the aircraft that were not seen for too long.
+        @snapshot: An AdsbColumnarSnapshot.
+        @now: Time of the snapshot in Unix epoch seconds, the snapshot's own by default.
+        Returns the number of aircraft tracked, new, appended to and evicted.
+        """
+        columns = snapshot.columns
+        now = snapshot.now if now is None else now
+        valid = np.isfinite(columns["lat"]) & np.isfinite(columns["lon"])
+        hexes, first = np.unique(columns["hex"][valid], return_index=True)
+        keep = np.flatnonzero(valid)[first]
+
+        # Positions are as old as seen_pos, the time since the aircraft last reported one
+        values = dict(
+            time=now - np.nan_to_num(columns["seen_pos"][keep]),
+            lat=columns["lat"][keep],
+            lon=columns["lon"][keep],
+            alt=np.where(columns["airground"][keep] == 1, 0, columns["alt_baro"][keep]),
+            gs=columns["gs"][keep],
+            rate=columns["baro_rate"][keep],
+            track=columns["track"][keep],
+        )
+
+        rows = self.lookup(hexes)
+        new = rows < 0
+        if new.any():
+            rows[new] = self.__allocate(hexes[new])
+
+        last = self.buffers["time"][rows, (self.head[rows] - 1) % self.depth]
+        fresh = (self.length[rows] == 0) | (values["time"] > last)
+        written = rows[fresh]
+        column = self.head[written]
+        for name in fields:
+            self.buffers[name][written, column] = values[name][fresh]
+        self.head[written] = (column + 1) % self.depth
+        self.length[written] = np.minimum(self.length[written] + 1, self.depth)
+        self.seen[written] = values["time"][fresh]
+
+        evicted = self.evict(now)
+        return DotDict(tracked=len(self), appeared=int(new.sum()), appended=len(written), evicted=evicted)
+
+    def evict(self, now: float) -> int:
+        """Stops tracking the aircraft whose last position is older than max_age seconds.
+        Returns the number of aircraft evicted."""
+        stale = ~(self.seen[self.rows] >= now - self.max_age)
+        if not stale.any():
+            return 0
+        self.__free = np.concatenate([self.__free, self.rows[stale]])
+        self.length[self.rows[stale]] = 0
+        self.hexes = self.hexes[~stale]
+        self.rows = self.rows[~stale]
+        return int(stale.sum())
+
+    def __allocate(self, hexes: np.ndarray) -> np.ndarray:
+        """Takes free rows for new aircraft, growing the buffers when there are not enough"""
+        if len(hexes) > len(self.__free):
+            capacity = len(self.head)
+            grown = max(2 * capacity, capacity + len(hexes) - len(self.__free))
+            for name in fields:
+                self.buffers[name] = np.concatenate([self.buffers[name], np.full((grown - capacity, self.depth), np.nan)])
+            self.head = np.concatenate([self.head, np.zeros(grown - capacity, dtype=np.intp)])
+            self.length = np.concatenate([self.length, np.zeros(grown - capacity, dtype=np.intp)])
+            self.seen = np.concatenate([self.seen, np.full(grown - capacity, np.nan)])
+            self.__free = np.concatenate([np.arange(grown - 1, capacity - 1, -1), self.__free])
+
+        rows = self.__free[len(self.__free) - len(hexes):]
+        self.__free = self.__free[:len(self.__free) - len(hexes)]
+        self.head[rows] = 0
+        self.length[rows] = 0
+
+        hexes = np.concatenate([self.hexes, hexes])
+        order = np.argsort(hexes, kind="stable")
+        self.hexes = hexes[order]
+        self.rows = np.concatenate([self.rows, rows])[order]
+        return rows
+
+    def window(self, rows, size: int = None) -> DotDict:
+        """Gathers the last positions of rows.
+        @rows: Rows as returned by lookup, without -1.
+        @size: Number of positions, depth by default.
+        Returns a DotDict of (len(rows), size) arrays for every field, oldest position first and NaN padded at the start.
+        """
+        size = self.depth if size is None else min(size, self.depth)
+        rows = np.asarray(rows, dtype=np.intp)
+        columns = (self.head[rows, None] - size + np.arange(size)) % self.depth
+        held = np.arange(size) >= size - np.minimum(self.length[rows], size)[:, None]
+        return DotDict((name, np.where(held, self.buffers[name][rows[:, None], columns], np.nan)) for name in fields)
+
+    def history(self, hex: str) -> DotDict:
+        """The kept positions of an aircraft as arrays of every field, oldest first, or None when it is not tracked"""
+        row = self.lookup([hex])[0]
+        if row < 0:
+            return None
+        count = self.length[row]
+        return DotDict((name, values[0, self.depth - count:]) for name, values in self.window([row]).items())
+
+    def features(self, hexes, size: int = None, min_distance: float = 0.5) -> DotDict:
+        """Computes windowed features of aircraft.
+        @hexes: The aircraft, e.g. the hex column of snapshot_features.
+        @size: Number of most recent positions in the window, depth by default.
+        @min_distance: Distance in nautical miles the aircraft must have flown in the window for the features.
+        Returns a DotDict of arrays aligned with hexes: points (positions in the window), grad (smoothed gradient,
+        the altitude change over the distance flown in feet per nautical mile, the unit of the instantaneous one)
+        and deviation (largest distance in nautical miles of a position from the line between the first and last
+        one). Features are NaN for aircraft that are not tracked or did not fly far enough.
+        """
+        rows = self.lookup(hexes)
+        known = np.flatnonzero(rows >= 0)
+        points = np.zeros(len(rows), dtype=np.intp)
+        grad = np.full(len(rows), np.nan)
+        deviation = np.full(len(rows), np.nan)
+        if len(known) == 0:
+            return DotDict(points=points, grad=grad, deviation=deviation)
+
+        window = self.window(rows[known], size)
+        lat, lon, alt = window.lat, window.lon, window.alt
+        size = lat.shape[1]
+        count = np.isfinite(lat).sum(axis=1)
+        start = np.maximum(size - count, 0)
+        index = np.arange(len(known))
+        flown = np.nansum(distance_nm(lat[:, :-1], lon[:, :-1], lat[:, 1:], lon[:, 1:]), axis=1)
+
+        # Positions on a local plane in nautical miles, relative to the first one
+        lat0, lon0 = lat[index, start], lon[index, start]
+        y = 60 * (lat - lat0[:, None])
+        x = 60 * ((lon - lon0[:, None] + 180) % 360 - 180) * np.cos(np.radians(lat0))[:, None]
+        dx, dy = x[:, -1], y[:, -1]
+        chord = np.hypot(dx, dy)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            climb = (alt[:, -1] - alt[index, start]) / flown
+            cross = np.abs(x * dy[:, None] - y * dx[:, None]) / chord[:, None]
+        far = (count >= 2) & (flown >= min_distance)
+        points[known] = count
+        grad[known] = np.where(far, climb, np.nan)
+        deviation[known] = np.where(far & (chord > 0), np.fmax.reduce(cross, axis=1), np.nan)
+        return DotDict(points=points, grad=grad, deviation=deviation)
@@ -1,58 +1,164 @@
+from spatial import GridIndex
+import csv
+import functools
+import math
 import os
+import pickle
+import numpy as np
 
 path = os.environ['FLIGHTS_PATH'] if 'FLIGHTS_PATH' in os.environ else None
 path = "" if path is None else path
 
+data = path if path else os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+"""Directory of the harvested frames, FLIGHTS_PATH when set and the repository root otherwise"""
 
-def pull_airport(ident, airports):
-    minim = 0
-    maxim = len(airports) - 1
-    midpoint = 0
-    real = None
-    while minim != maxim and ident != real:
-        midpoint = int((minim + maxim) / 2)
-        real = airports[midpoint][0]
-        if ident < real:
+cache = os.environ['ADSB_CACHE'] if 'ADSB_CACHE' in os.environ else os.path.join(os.path.expanduser("~"), ".cache", "adsblookup")
+"""Directory holding files derived from downloads or packaged data, safe to delete"""
 
-            maxim = midpoint - 1
-        if ident > real:
 
-            minim = midpoint + 1
-        if ident == real:
-            maxim = midpoint
-    return airports[maxim]
+def cache_path(name):
+    """Path of a file in the cache directory, creating the directory if needed"""
+    os.makedirs(cache, exist_ok=True)
+    return os.path.join(cache, name)
+
+
+class AirportNotFound(KeyError):
+    """Raised when an ident is not in the airport database"""
+
+
+class AirportIndex:
+    """Airports from airports.csv, indexed by ICAO ident and by position"""
+
+    version = 1
+    "Bumped whenever the pickled layout changes"
+
+    def __init__(self, idents: list, names: list, lat, lon) -> None:
+        self.idents = idents
+        "ICAO idents of the airports"
+        self.names = names
+        "Names of the airports"
+        self.lat = np.asarray(lat, dtype=np.float64)
+        "Latitudes of the airports in decimal degrees"
+        self.lon = np.asarray(lon, dtype=np.float64)
+        "Longitudes of the airports in decimal degrees"
+        self.rows = {ident: i for i, ident in enumerate(idents)}
+        "Row of each ident"
+        self.grid = GridIndex(self.lat, self.lon)
+        "Spatial index of the airports"
+
+    def __len__(self) -> int:
+        return len(self.idents)
+
+    def __contains__(self, ident) -> bool:
+        return ident in self.rows
+
+    def lookup(self, ident: str) -> list:
+        """Finds an airport by ICAO ident.
+        Returns [ident, lat, lon] and raises AirportNotFound for unknown idents.
+        """
+        row = self.rows.get(ident.strip().upper())
+        if row is None:
+            raise AirportNotFound(ident)
+        return [self.idents[row], float(self.lat[row]), float(self.lon[row])]
+
+    def within(self, lat: float, lon: float, radius: float) -> list:
+        """Finds the airports within a radius of a point, closest first.
+        @radius: The radius in nautical miles.
+        Returns [ident, lat, lon, distance] for each airport.
+        """
+        rows, distances = self.grid.within(lat, lon, radius)
+        return [
+            [self.idents[row], float(self.lat[row]), float(self.lon[row]), float(distance)]
+            for row, distance in zip(rows.tolist(), distances.tolist())
+        ]
+
+    @staticmethod
+    def build(filename: str) -> "AirportIndex":
+        """Builds the index from an airports.csv file. Airports without an ICAO ident are skipped."""
+        idents, names, lat, lon = [], [], [], []
+        seen = set()
+        with open(filename, newline="", encoding="utf-8") as file:
+            for row in csv.DictReader(file):
+                ident = row["icao"].strip().upper()
+                if not ident or ident in seen:
+                    continue
+                try:
+                    position = float(row["latitude"]), float(row["longitude"])
+                except ValueError:
+                    continue
+                seen.add(ident)
+                idents.append(ident)
+                names.append(row["airport"])
+                lat.append(position[0])
+                lon.append(position[1])
+        return AirportIndex(idents, names, lat, lon)
+
+
+airports_csv = path + "airports.csv" if path else os.path.join(os.path.dirname(os.path.abspath(__file__)), "airports.csv")
+"""Source of the airport database"""
+
+airports_txt = path + "airports.txt" if path else os.path.join(os.path.dirname(os.path.abspath(__file__)), "airports.txt")
+"""ICAO idents of the monitored airports, one per line"""
+
+
+@functools.lru_cache(maxsize=None)
+def airports() -> AirportIndex:
+    """Returns the airport index, loaded once per process.
+    The index is pickled in the cache directory and rebuilt when airports.csv changes."""
+    stat = os.stat(airports_csv)
+    key = f"{AirportIndex.version}-{stat.st_size}-{stat.st_mtime_ns}"
+    cached = cache_path("airports.pickle")
+    try:
+        with open(cached, "rb") as file:
+            stored_key, index = pickle.load(file)
+        if stored_key == key:
+            return index
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, AttributeError, ImportError):
+        pass
+
+    index = AirportIndex.build(airports_csv)
+    tmp = cached + ".tmp"
+    with open(tmp, "wb") as file:
+        pickle.dump((key, index), file, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, cached)
+    return index
+
+
+def pull_airport(ident):
+    """Finds an airport by ICAO ident.
+    Returns [ident, lat, lon] and raises AirportNotFound for unknown idents.
+    """
+    return airports().lookup(ident)
 
 
 def find_airports(preset=[]):
+    """Finds the monitored airports listed in airports.txt, or the given idents.
+    Returns [ident, lat, lon] for each airport.
+    """
     lines = preset
     if preset == []:
-        file = open(path + "airports.txt")
-        lines = [line for line in file.read().split("\n") if len(line) > 0]
+        file = open(airports_txt)
+        lines = [line.strip() for line in file.read().split("\n") if len(line.strip()) > 0]
         file.close()
-    file = open(path + "database.csv")
-    airports = [[part for part in line.split(",") if len(part) > 0] for line in file.read().split("\n") if len(line) > 0]
-    molded = []
-    for airport in airports:
-        try:
-            molded.append([airport[0], float(airport[1]), float(airport[2])])
-        finally:
-            continue
-    file.close()
 
     print(lines)
 
-    return [pull_airport(ident, molded) for ident in lines]
-
-def build_database():
-    locs = [
-        [part[1:-1] for part in line.split(",") if len(part) > 0]
-        for line in open(path + "airports.csv").read().split("\n") if len(line) > 0
-    ]
-    filtered = [[loc[3], loc[5], loc[6]] for loc in locs]
-    ordered = sorted(filtered, key=lambda x: x[0])
-    file = open(path + "database.csv", "w")
-    for order in ordered:
-        for part in order:
-            file.write(part + ",")
-        file.write("\n")
-    file.close()
+    return [pull_airport(ident) for ident in lines]
+
+
+def bounding_box(lat, lon, radius):
+    """Bounding box around a point, formatted as (lat_min, lat_max, lon_min, lon_max) for pull_snapshot.
+    @lat: Latitude of the center in decimal degrees.
+    @lon: Longitude of the center in decimal degrees.
+    @radius: Half-width of the box in nautical miles.
+    A box is a single latitude/longitude range, so latitudes are clamped at the poles, and a box reaching a pole or
+    crossing the antimeridian spans every longitude instead of being split. Such boxes hold more than the radius.
+    """
+    dlat = radius / 60
+    lat_min, lat_max = max(lat - dlat, -90), min(lat + dlat, 90)
+    if lat_min <= -90 or lat_max >= 90:
+        return (lat_min, lat_max, -180, 180)
+    dlon = dlat / math.cos(math.radians(lat))
+    if lon - dlon < -180 or lon + dlon > 180:
+        return (lat_min, lat_max, -180, 180)
+    return (lat_min, lat_max, lon - dlon, lon + dlon)
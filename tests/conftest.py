@@ -0,0 +1,69 @@
+import http.server
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+# The modules of adsblookup import each other by flat name, as they do when run from src/adsblookup
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src", "adsblookup"))
+
+
+class StandIn(http.server.ThreadingHTTPServer):
+    """Local HTTP server standing in for adsbexchange.com, answering every path with scripted responses"""
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server_address[1]}"
+        self.responses = {}
+        self.requests = []
+        "Path and headers of every request received, in order"
+
+    def respond(self, path: str, *responses) -> None:
+        """Scripts the responses to a path, each a (status, body, headers, delay) tuple that may stop after the status.
+        The last response is repeated."""
+        self.responses[path] = list(responses)
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        path = self.path.split("?")[0]
+        self.server.requests.append((self.path, dict(self.headers)))
+        scripted = self.server.responses.get(path, [(404, b"")])
+        response = scripted.pop(0) if len(scripted) > 1 else scripted[0]
+        status, body, headers, delay = response + (b"", {}, 0)[len(response) - 1:]
+        time.sleep(delay)
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture(autouse=True)
+def cache(tmp_path, monkeypatch):
+    """Keeps the airport index, models and other cached files out of the real cache directory"""
+    import utils
+    directory = str(tmp_path / "cache")
+    monkeypatch.setenv("ADSB_CACHE", directory)
+    monkeypatch.setattr(utils, "cache", directory)
+    return directory
+
+
+@pytest.fixture
+def server():
+    server = StandIn()
+    thread = threading.Thread(target=server.serve_forever, kwargs=dict(poll_interval=0.05), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
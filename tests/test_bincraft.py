@@ -0,0 +1,114 @@
+import math
+
+import numpy as np
+import pytest
+
+import bincraft
+from benchmark import synthetic_frame
+from classes import AdsbSnapshot
+
+
+def frame(count, stride=112, seed=0):
+    """A synthetic frame whose records cover high squawks, the ground flag and void bits"""
+    raw = synthetic_frame(count, box=(36, 42, -110, -100), stride=stride, seed=seed)
+    records = np.frombuffer(raw[stride:], dtype=np.uint8).reshape(count, stride).copy()
+    squawks = np.array([0x1200, 0x7700, 0x9fff, 0xa000, 0xa123, 0xf777], dtype="<u2")
+    records[:, 32:34] = np.resize(squawks, count).view(np.uint8).reshape(count, 2)
+    records[::3, 68] = (records[::3, 68] & 0xf0) | 1
+    # Every value void, then every value valid
+    records[: count // 4, 73:78] = 0
+    records[count // 4: count // 2, 73:78] = 0xff
+    return raw[:stride] + records.tobytes()
+
+
+def same(old, new):
+    if isinstance(old, float) and isinstance(new, float):
+        return math.isclose(old, new, rel_tol=1e-12) or old == new
+    return old == new and (type(old) is type(new) or {type(old), type(new)} == {int, float})
+
+
+@pytest.mark.parametrize("stride, seed", [(112, 0), (112, 1), (120, 2)])
+def test_columns_match_records(stride, seed):
+    raw = frame(400, stride, seed)
+    old = bincraft.__wqi(bytearray(raw))
+    parsed = bincraft.__wqi_columns(raw)
+    assert {key: value for key, value in old.items() if key != "aircraft"} == \
+           {key: value for key, value in parsed.items() if key != "aircraft"}
+
+    new = bincraft.__wqi_records(parsed["aircraft"])
+    assert len(new) == len(old["aircraft"]) == 400
+    for before, after in zip(old["aircraft"], new):
+        assert list(before) == list(after)
+        for key in before:
+            assert same(before[key], after[key]), (key, before[key], after[key])
+
+    squawks = {ac.squawk for ac in new}
+    assert {"10123", "15777"} <= squawks
+    assert any(ac.alt_baro == "ground" for ac in new)
+    assert all(ac.lat is None and ac.gs is None for ac in new[:100])
+
+
+def test_record_snapshot():
+    raw = frame(400)
+    old = AdsbSnapshot(bincraft.__wqi(bytearray(raw)))
+    new = bincraft.__snapshot(bincraft.__wqi_columns(raw), False)
+    assert isinstance(new, AdsbSnapshot)
+    assert {key: value for key, value in old.items() if key != "aircraft"} == \
+           {key: value for key, value in new.items() if key != "aircraft"}
+    for before, after in zip(old.aircraft, new.aircraft):
+        assert type(after) is type(before)
+        assert list(before) == list(after)
+        for key in before:
+            assert same(before[key], after[key]), (key, before[key], after[key])
+
+
+@pytest.fixture
+def adsbexchange(server, monkeypatch):
+    """The server stand-in serving a compressed bincraft of aircraft over Colorado and Kansas at the re-api"""
+    import fetch
+    from benchmark import compress
+    monkeypatch.setattr(fetch, "base_url", server.url)
+    server.respond("/re-api/", (200, compress(frame(400))))
+    return server
+
+
+def query_box(path):
+    return tuple(float(value) for value in path.split("box=")[1].split(","))
+
+
+def test_pull_snapshot(adsbexchange):
+    box = (38, 40, -106, -103)
+    snapshot = bincraft.pull_snapshot(box, columnar=True)
+    assert len(adsbexchange.requests) == 1
+    assert query_box(adsbexchange.requests[0][0]) == box
+    lat, lon = snapshot.columns["lat"], snapshot.columns["lon"]
+    assert 0 < len(snapshot.aircraft) < 400
+    assert ((lat >= 38) & (lat <= 40) & (lon >= -106) & (lon <= -103)).all()
+
+    records = bincraft.pull_snapshot(box)
+    assert [ac.hex for ac in records.aircraft] == snapshot.columns["hex"].tolist()
+
+
+def test_pull_snapshots(adsbexchange):
+    boxes = [(38, 40, -106, -103), (37, 39, -102, -100)]
+    snapshots = bincraft.pull_snapshots(boxes, columnar=True)
+    assert len(adsbexchange.requests) == 1
+    assert query_box(adsbexchange.requests[0][0]) == (37, 40, -106, -100)
+    assert len(snapshots) == 2
+    for box, snapshot in zip(boxes, snapshots):
+        assert [ac.hex for ac in snapshot.aircraft] == bincraft.pull_snapshot(box, columnar=True).columns["hex"].tolist()
+        lat, lon = snapshot.columns["lat"], snapshot.columns["lon"]
+        assert ((lat >= box[0]) & (lat <= box[1]) & (lon >= box[2]) & (lon <= box[3])).all()
+
+
+def test_pull_snapshot_failure(adsbexchange):
+    adsbexchange.respond("/re-api/", (403,))
+    with pytest.raises(Exception, match="403"):
+        bincraft.pull_snapshot((38, 40, -106, -103))
+
+
+def test_pull_snapshot_from_source():
+    from benchmark import MemorySource, compress
+    source = MemorySource([compress(frame(400))])
+    snapshot = bincraft.pull_snapshot((38, 40, -106, -103), columnar=True, source=source)
+    assert 0 < len(snapshot.aircraft) < 400
@@ -0,0 +1,111 @@
+import os
+
+import numpy as np
+import pytest
+
+import bincraft
+import capture
+from benchmark import compress, synthetic_frame
+from classes import DotDict
+
+
+class Source:
+    """Serves numbered snapshots and traces from memory, and a 404 for unknown aircraft"""
+
+    host = "example.invalid"
+
+    def __init__(self) -> None:
+        self.served = 0
+
+    def snapshot(self, box: tuple) -> DotDict:
+        self.served += 1
+        return DotDict(status=200, content=f"snapshot {self.served}".encode(), headers={}, cached=False)
+
+    def trace(self, icao: str, recent: bool = False) -> DotDict:
+        if icao == "000000":
+            return DotDict(status=404, content=b"", headers={}, cached=False)
+        self.served += 1
+        return DotDict(status=200, content=f"{icao} {recent} {self.served}".encode(), headers={}, cached=False)
+
+
+def record(filename):
+    with capture.Recorder(filename, Source()) as recorder:
+        assert recorder.host == "example.invalid"
+        recorder.snapshot((36, 42, -110, -100))
+        recorder.trace("a1b2c3")
+        recorder.trace("a1b2c3", recent=True)
+        assert recorder.trace("000000").status == 404
+        recorder.snapshot((36, 42, -110, -100))
+        recorder.trace("a1b2c3")
+        return recorder.records
+
+
+def test_round_trip(tmp_path):
+    filename = str(tmp_path / "traffic.cap")
+    assert record(filename) == 5
+    with capture.Replay(filename) as replay:
+        assert len(replay) == 5
+        assert replay.index["kind"].tolist() == [capture.snapshot, capture.trace_full, capture.trace_recent,
+                                                 capture.snapshot, capture.trace_full]
+        assert np.allclose(replay.index["box"][0], (36, 42, -110, -100))
+        assert replay.snapshot(None).content == b"snapshot 1"
+        assert replay.snapshot(None).content == b"snapshot 4"
+        with pytest.raises(EOFError):
+            replay.snapshot(None)
+        assert replay.trace("A1B2C3").content == b"a1b2c3 False 2"
+        assert replay.trace("a1b2c3").content == b"a1b2c3 False 5"
+        assert replay.trace("a1b2c3").content == b"a1b2c3 False 5"
+        assert replay.trace("a1b2c3", recent=True).content == b"a1b2c3 True 3"
+        assert replay.trace("000000").status == 404
+        replay.rewind()
+        assert replay.snapshot(None).content == b"snapshot 1"
+
+    with capture.Replay(filename, loop=True) as replay:
+        assert [replay.snapshot(None).content for i in range(3)] == [b"snapshot 1", b"snapshot 4", b"snapshot 1"]
+
+
+def test_replay_decodes_like_the_recorded_frame(tmp_path):
+    filename = str(tmp_path / "traffic.cap")
+    frame = synthetic_frame(100, box=(36, 42, -110, -100))
+    with capture.Recorder(filename, source=Source()) as recorder:
+        recorder.write(capture.snapshot, compress(frame), box=(36, 42, -110, -100))
+    with capture.Replay(filename) as replay:
+        snapshot = bincraft.pull_snapshot((36, 42, -110, -100), columnar=True, source=replay)
+    columns = bincraft.__wqi_columns(frame)["aircraft"]
+    assert snapshot.columns["hex"].tolist() == columns["hex"][np.isfinite(columns["lat"])].tolist()
+
+
+def test_truncated_capture_is_recovered(tmp_path):
+    filename = str(tmp_path / "traffic.cap")
+    record(filename)
+    complete = os.path.getsize(filename)
+    # A recording interrupted in the middle of a payload, with its index lost
+    with open(filename, "ab") as file:
+        entry = np.zeros(1, dtype=capture.index_dtype)
+        entry["offset"] = complete + capture.index_dtype.itemsize
+        entry["length"] = 1000
+        file.write(entry.tobytes() + b"partial")
+    os.remove(filename + ".idx")
+
+    index = capture.read_index(filename)
+    assert len(index) == 5
+    assert int(index["offset"][-1] + index["length"][-1]) == complete
+
+    # Appending cuts the partial record off and rewrites the index
+    with capture.Recorder(filename, Source()) as recorder:
+        assert recorder.records == 5
+        recorder.snapshot(None)
+    with capture.Replay(filename) as replay:
+        assert len(replay) == 6
+        assert [replay.content(row) for row in replay.snapshots] == [b"snapshot 1", b"snapshot 4", b"snapshot 1"]
+
+
+def test_truncated_index_is_rebuilt(tmp_path):
+    filename = str(tmp_path / "traffic.cap")
+    record(filename)
+    # An index entry cut in half, and the entries after it lost
+    size = os.path.getsize(filename + ".idx")
+    os.truncate(filename + ".idx", size - capture.index_dtype.itemsize * 2 - 5)
+    index = capture.read_index(filename)
+    assert index["kind"].tolist() == [capture.snapshot, capture.trace_full, capture.trace_recent,
+                                      capture.snapshot, capture.trace_full]
@@ -0,0 +1,59 @@
+import copy
+import json
+import os
+import pickle
+
+import pytest
+
+from classes import DotDict, AdsbAircraft, AdsbTrace, AdsbTraceState
+
+
+def test_dotdict_reads_keys():
+    d = DotDict(hex="abc123", gs=0, alt=None)
+    assert d.hex == "abc123"
+    assert d.gs == 0
+    assert d.alt is None
+    assert d.missing is None
+    d.track = 90
+    assert d["track"] == 90
+    del d.track
+    assert "track" not in d
+
+
+def test_dotdict_keeps_dict_methods():
+    d = DotDict(items=1, get=2, keys=3)
+    assert list(d.items()) == [("items", 1), ("get", 2), ("keys", 3)]
+    assert d.get("keys") == 3
+    assert len(d.keys()) == 3
+    assert d["items"] == 1
+
+
+def test_dotdict_dunders_raise():
+    d = DotDict(a=1)
+    with pytest.raises(AttributeError):
+        d.__missing_dunder__
+    assert pickle.loads(pickle.dumps(d)) == d
+    assert copy.deepcopy(d) == d
+
+
+def test_aircraft_class_attributes():
+    aircraft = AdsbAircraft(hex="abc123")
+    assert aircraft.fields[0] == "hex"
+
+
+def load_trace():
+    with open(os.path.join(os.path.dirname(__file__), "data", "trace_full_a1b2c3.json")) as f:
+        return json.load(f)
+
+
+def test_trace_states_round_trip():
+    raw = load_trace()
+    trace = AdsbTrace(raw)
+    expected = AdsbTrace(raw)
+    # What AdsbTrace held before its states were columnar
+    expected.states = [AdsbTraceState(state) for state in raw["trace"]]
+    assert trace.toJson() == expected.toJson()
+    assert len(trace.states) == len(raw["trace"])
+    assert trace.states[-1] == expected.states[-1]
+    assert trace.states[3].roll == 0 and type(trace.states[3].roll) is int
+    assert type(trace.states[-4].roll) is float
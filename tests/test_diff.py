@@ -0,0 +1,74 @@
+import numpy as np
+
+import bincraft
+import diff
+from benchmark import synthetic_frame
+
+
+def snapshots(columnar):
+    """Two snapshots of the same aircraft, the second with changes of every kind diff reports"""
+    before = bincraft.__wqi_columns(synthetic_frame(200, box=(36, 42, -110, -100), seed=0))
+    after = bincraft.__wqi_columns(synthetic_frame(200, box=(36, 42, -110, -100), seed=0))
+    for parsed in (before, after):
+        columns = parsed["aircraft"]
+        columns["seen"][:] = 1
+        columns["seen_pos"][:] = 1
+        columns["squawk"][:] = "1200"
+        columns["lat"][np.isnan(columns["lat"])] = 39
+        columns["lon"][np.isnan(columns["lon"])] = -105
+        columns["alt_baro"][:] = 10000
+    columns = after["aircraft"]
+    columns["lat"][0] += 0.5
+    columns["alt_baro"][1] += 1000
+    columns["squawk"][2] = "7700"
+    columns["seen"][3] = 600
+    return bincraft.__snapshot(before, columnar), bincraft.__snapshot(after, columnar)
+
+
+def test_diff_columnar():
+    result = diff.diff(*snapshots(True))
+    assert result.appeared.tolist() == []
+    assert result.departed.tolist() == [3]
+    assert result.moved.tolist() == [0, 1, 2]
+    assert result.position.tolist() == [True, False, False]
+    assert result.altitude.tolist() == [False, True, False]
+    assert result.squawk.tolist() == [False, False, True]
+
+
+def test_diff_records():
+    previous, current = snapshots(False)
+    assert current.aircraft[2].squawk == "7700"
+    assert current.aircraft[3].seen == 600
+    result = diff.diff(previous, current)
+    expected = diff.diff(*snapshots(True))
+    assert result.keys() == expected.keys()
+    for key in expected:
+        assert result[key].tolist() == expected[key].tolist(), key
+
+
+def test_diff_unchanged():
+    previous, current = snapshots(False)
+    result = diff.diff(previous, previous)
+    assert len(result.changed) == len(result.departed) == 0
+
+
+def test_diff_ground_aircraft():
+    """Aircraft on the ground have no barometric altitude in either kind of snapshot"""
+    results = []
+    for columnar in (True, False):
+        before = bincraft.__wqi_columns(synthetic_frame(20, box=(36, 42, -110, -100), seed=0))
+        after = bincraft.__wqi_columns(synthetic_frame(20, box=(36, 42, -110, -100), seed=0))
+        for parsed in (before, after):
+            columns = parsed["aircraft"]
+            columns["seen"][:] = columns["seen_pos"][:] = 1
+            columns["squawk"][:] = "1200"
+            columns["alt_baro"][:] = 10000
+            columns["airground"][:] = 0
+        # Taxiing with a changing altitude, then landing
+        before["aircraft"]["airground"][0] = after["aircraft"]["airground"][0] = 1
+        after["aircraft"]["alt_baro"][0] = 11000
+        after["aircraft"]["airground"][1] = 1
+        result = diff.diff(bincraft.__snapshot(before, columnar), bincraft.__snapshot(after, columnar))
+        results.append({key: value.tolist() for key, value in result.items()})
+    assert results[0] == results[1]
+    assert results[0]["moved"] == []
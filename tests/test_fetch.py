@@ -0,0 +1,74 @@
+import time
+
+import pytest
+import requests
+
+import fetch
+
+
+def test_retries_until_success(server):
+    server.respond("/data", (503,), (502, b"busy"), (200, b"ok"))
+    fetcher = fetch.Fetcher(backoff=0.01)
+    response = fetcher.get(server.url + "/data")
+    assert response.status == 200
+    assert response.content == b"ok"
+    assert not response.cached
+    assert len(server.requests) == 3
+    stats = fetcher.stats.summary()
+    assert (stats.requests, stats.retries, stats.failures) == (3, 2, 2)
+
+
+def test_returns_last_status_when_retries_run_out(server):
+    server.respond("/data", (503, b"busy"))
+    fetcher = fetch.Fetcher(retries=2, backoff=0.01)
+    response = fetcher.get(server.url + "/data")
+    assert response.status == 503
+    assert len(server.requests) == 3
+
+
+def test_does_not_retry_client_errors(server):
+    server.respond("/data", (404,))
+    response = fetch.Fetcher(backoff=0.01).get(server.url + "/data")
+    assert response.status == 404
+    assert len(server.requests) == 1
+
+
+def test_revalidates_with_etag(server):
+    server.respond("/trace", (200, b"trace", {"ETag": '"v1"'}), (304,))
+    fetcher = fetch.Fetcher()
+    first = fetcher.get(server.url + "/trace", conditional=True)
+    second = fetcher.get(server.url + "/trace", conditional=True)
+    assert (first.status, first.content, first.cached) == (200, b"trace", False)
+    assert (second.status, second.content, second.cached) == (200, b"trace", True)
+    assert "If-None-Match" not in server.requests[0][1]
+    assert server.requests[1][1]["If-None-Match"] == '"v1"'
+    assert fetcher.stats.summary().not_modified == 1
+
+
+def test_unconditional_requests_are_not_revalidated(server):
+    server.respond("/trace", (200, b"trace", {"ETag": '"v1"'}))
+    fetcher = fetch.Fetcher()
+    fetcher.get(server.url + "/trace")
+    fetcher.get(server.url + "/trace", conditional=True)
+    assert "If-None-Match" not in server.requests[1][1]
+
+
+def test_changed_response_replaces_cached_copy(server):
+    server.respond("/trace", (200, b"old", {"ETag": '"v1"'}), (200, b"new", {"ETag": '"v2"'}), (304,))
+    fetcher = fetch.Fetcher()
+    fetcher.get(server.url + "/trace", conditional=True)
+    assert fetcher.get(server.url + "/trace", conditional=True).content == b"new"
+    third = fetcher.get(server.url + "/trace", conditional=True)
+    assert server.requests[2][1]["If-None-Match"] == '"v2"'
+    assert (third.content, third.cached) == (b"new", True)
+
+
+def test_stalled_server_times_out(server):
+    server.respond("/data", (200, b"late", {}, 2))
+    fetcher = fetch.Fetcher(timeout=(1, 0.2), retries=1, backoff=0.01)
+    start = time.perf_counter()
+    with pytest.raises(requests.Timeout):
+        fetcher.get(server.url + "/data")
+    assert time.perf_counter() - start < 1.5
+    assert len(server.requests) == 2
+    assert fetcher.stats.summary().failures == 2
@@ -0,0 +1,31 @@
+import os
+
+import numpy as np
+
+from framestore import FrameStore, records
+
+
+def test_reading_does_not_create_directory(tmp_path):
+    directory = str(tmp_path / "frames")
+    store = FrameStore(directory)
+    assert store.chunks() == []
+    assert store.airports() == []
+    assert len(store.read()) == 0
+    assert len(store) == 0
+    assert not os.path.exists(directory)
+
+
+def test_flush_creates_directory(tmp_path):
+    directory = str(tmp_path / "frames")
+    with FrameStore(directory) as store:
+        store.append(records(["a1b2c3"] * 2, [100.0, 105.0], [38.8, 38.9], [-104.7, -104.6], [9000, 8500], [-40, -38],
+                             "KCOS"))
+    assert len(store.chunks()) == 1
+    assert store.airports() == ["KCOS"]
+    assert np.allclose(store.read()["alt"], [9000, 8500])
+
+
+def test_records_of_empty_columns():
+    frames = records("a1b2c3", np.empty(0), np.empty(0), np.empty(0), np.empty(0), np.empty(0), "KCOS")
+    assert len(frames) == 0
+    assert len(records("a1b2c3", 100.0, 38.8, -104.7, 9000, -40, "KCOS")) == 1
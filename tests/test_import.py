@@ -0,0 +1,30 @@
+import json
+import os
+import subprocess
+import sys
+
+import benchmark
+
+here = os.path.dirname(os.path.abspath(benchmark.__file__))
+
+import_bound = 0.5
+"""Seconds importing bincraft may take beyond the interpreter's startup, NumPy included"""
+
+
+def imported(module: str) -> set:
+    """Modules loaded by importing a module in a fresh interpreter"""
+    code = f"import sys, json; before = set(sys.modules); import {module}; print(json.dumps(sorted(set(sys.modules) - before)))"
+    output = subprocess.run([sys.executable, "-c", code], cwd=here, check=True, capture_output=True, text=True).stdout
+    return set(json.loads(output))
+
+
+def test_import_time():
+    assert benchmark.bench_import("bincraft", repeat=3).seconds < import_bound
+
+
+def test_import_is_lazy():
+    loaded = imported("bincraft")
+    assert "bincraft" in loaded
+    # The WASM runtime, the native decoder and the HTTP stack load on first use
+    for module in ("wasmer", "wasmer_compiler_cranelift", "zstandard", "fetch", "requests"):
+        assert module not in loaded
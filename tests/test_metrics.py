@@ -0,0 +1,107 @@
+import re
+import time
+
+import pytest
+
+import metrics
+
+sample = re.compile(r'^([a-zA-Z_:][a-zA-Z0-9_:]*)(\{quantile="(0\.5|0\.9|0\.99)"\})? (-?[0-9.]+(e[+-]?[0-9]+)?|NaN|[+-]Inf)$')
+"""A sample line of the Prometheus text format, as written for counters, gauges and summaries"""
+
+
+@pytest.fixture(autouse=True)
+def disabled(monkeypatch):
+    """Restores the disabled sink after every test"""
+    monkeypatch.setattr(metrics, "sink", None)
+
+
+def test_counters_and_gauges_accumulate():
+    registry = metrics.Registry()
+    metrics.configure(registry)
+    metrics.count("frames")
+    metrics.count("frames")
+    metrics.count("bytes", 1500)
+    metrics.count("bytes", 500)
+    metrics.gauge("pending", 3)
+    metrics.gauge("pending", 1)
+    summary = registry.summary()
+    assert summary.counters == {"frames": 2, "bytes": 2000}
+    assert summary.gauges == {"pending": 1}
+
+
+def test_timers():
+    registry = metrics.Registry(history=3)
+    metrics.configure(registry)
+
+    @metrics.timed("decode")
+    def decode(value):
+        if value is None:
+            raise ValueError(value)
+        return value * 2
+
+    assert decode(2) == 4
+    with pytest.raises(ValueError):
+        decode(None)
+    with metrics.timer("draw"):
+        time.sleep(0.01)
+    for seconds in (1, 2, 3, 4):
+        metrics.observe("fetch", seconds)
+    timers = registry.summary().timers
+    assert timers["decode"].count == 2
+    assert timers["draw"].count == 1 and timers["draw"].sum >= 0.01
+    # Percentiles only cover the recent durations
+    fetch = timers["fetch"]
+    assert (fetch.count, fetch.sum, fetch.p50, fetch.p99) == (4, 10, 3, 4)
+
+
+def test_disabled_metrics_do_nothing():
+    @metrics.timed("decode")
+    def decode():
+        return 1
+
+    assert decode() == 1
+    metrics.count("frames")
+    with metrics.timer("draw"):
+        pass
+    assert metrics.sink is None
+
+
+def test_prometheus_text(tmp_path):
+    filename = str(tmp_path / "adsb.prom")
+    sink = metrics.PrometheusFile(filename, interval=3600)
+    metrics.configure(sink)
+    metrics.count("snapshot_bytes", 2048)
+    metrics.count("frames")
+    metrics.gauge("pending_traces", 12)
+    metrics.observe("decode", 0.25)
+    metrics.observe("decode", 1e-6)
+    # The first report wrote the file, later ones wait for the interval
+    with open(filename) as file:
+        assert file.read() == "# TYPE adsb_snapshot_bytes_total counter\nadsb_snapshot_bytes_total 2048\n"
+    sink.write()
+    with open(filename) as file:
+        lines = file.read().splitlines()
+
+    declared = {}
+    values = {}
+    for line in lines:
+        if line.startswith("# TYPE "):
+            name, kind = line[len("# TYPE "):].split(" ")
+            assert name not in declared
+            declared[name] = kind
+            continue
+        match = sample.match(line)
+        assert match, line
+        name = match[1]
+        family = re.sub(r"_(sum|count)$", "", name) if declared.get(name) is None else name
+        assert family in declared, line
+        values[name + (match[2] or "")] = float(match[4])
+    assert declared == {"adsb_snapshot_bytes_total": "counter", "adsb_frames_total": "counter",
+                        "adsb_pending_traces": "gauge", "adsb_decode_seconds": "summary"}
+    assert values["adsb_snapshot_bytes_total"] == 2048
+    assert values["adsb_frames_total"] == 1
+    assert values["adsb_pending_traces"] == 12
+    assert values["adsb_decode_seconds_count"] == 2
+    assert values["adsb_decode_seconds_sum"] == pytest.approx(0.250001)
+    assert values['adsb_decode_seconds{quantile="0.99"}'] == 0.25
+    assert not (tmp_path / "adsb.prom.tmp").exists()
@@ -0,0 +1,23 @@
+import os
+
+import models
+import utils
+
+
+def test_paths_do_not_depend_on_working_directory(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    assert [airport[0] for airport in utils.find_airports()] == ["KAFF", "KCOS", "KDSM", "KDEN"]
+    assert os.path.exists(os.path.join(models.csv_directory, "KCOS.csv"))
+    assert os.path.exists(os.path.join(models.csv_directory, "KDEN.csv"))
+
+
+def test_default_store_does_not_depend_on_working_directory(tmp_path, monkeypatch):
+    from framestore import FrameStore
+    monkeypatch.chdir(tmp_path)
+    assert FrameStore().directory == os.path.join(models.csv_directory, "frames")
+
+
+def test_cache_stays_in_test_directory(cache):
+    utils.airports.cache_clear()
+    assert utils.pull_airport("KCOS")[0] == "KCOS"
+    assert os.path.exists(os.path.join(cache, "airports.pickle"))
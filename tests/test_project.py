@@ -0,0 +1,63 @@
+import json
+
+from classes import DotDict
+from framestore import FrameStore
+from project import Harvester
+
+
+class TraceSource:
+    """Serves raw traces from memory, keyed by hex"""
+
+    host = None
+
+    def __init__(self, traces: dict) -> None:
+        self.traces = traces
+
+    def trace(self, icao: str, recent: bool = False) -> DotDict:
+        if icao not in self.traces:
+            return DotDict(status=404, content=b"", headers={}, cached=False)
+        return DotDict(status=200, content=json.dumps(self.traces[icao]).encode(), headers={}, cached=False)
+
+
+def approach(icao, lat, lon, count=60):
+    """Raw trace of an aircraft descending towards a position from the west"""
+    trace = [[5.0 * i, lat, lon - 0.5 + i * 0.5 / count, 9000 - 100 * i, 180, 90, 0, -1000, None, "adsb_icao"]
+             for i in range(count)]
+    return {"icao": icao, "timestamp": 1700000000, "dbFlags": 0, "trace": trace}
+
+
+def test_frames_without_rows_near_an_airport(tmp_path):
+    parked = approach("a00002", 38.8, -104.7)
+    for state in parked["trace"]:
+        state[3] = "ground"
+    source = TraceSource({"a00001": approach("a00001", 38.8, -104.7), "a00002": parked})
+    harvester = Harvester(store=FrameStore(str(tmp_path / "frames")), source=source)
+    airports = [("KCOS", 38.8, -104.7), ("KDEN", 39.86, -104.67)]
+
+    frames = harvester._Harvester__frames("a00001", airports)
+    assert len(frames["KCOS"]) > 0
+    assert len(frames["KDEN"]) == 0
+    frames = harvester._Harvester__frames("a00002", airports)
+    assert len(frames["KCOS"]) == len(frames["KDEN"]) == 0
+
+
+def test_harvest_survives_failed_traces(server, monkeypatch, tmp_path):
+    import fetch
+    monkeypatch.setattr(fetch, "base_url", server.url)
+    monkeypatch.setattr(fetch, "__fetcher", fetch.Fetcher(retries=1, backoff=0.01))
+    good = approach("a00001", 38.8, -104.7)
+    broken = approach("a00003", 38.8, -104.7)
+    broken["trace"][3][1] = "north"
+    server.respond("/data/traces/01/trace_recent_a00001.json", (200, json.dumps(good).encode()))
+    server.respond("/data/traces/02/trace_recent_a00002.json", (503,))
+    server.respond("/data/traces/03/trace_recent_a00003.json", (200, json.dumps(broken).encode()))
+    server.respond("/data/traces/04/trace_recent_a00004.json", (200, b"<html>"))
+    snapshot = DotDict(aircraft=[DotDict(hex=f"a0000{i}", category="A5", lat=38.8, lon=-104.7) for i in range(1, 6)])
+
+    store = FrameStore(str(tmp_path / "frames"))
+    harvester = Harvester(store=store)
+    counts = harvester.run([("KCOS", 38.8, -104.7)], [snapshot])
+    assert sorted(harvester.failed) == ["a00002", "a00003", "a00004", "a00005"]
+    assert counts["KCOS"] > 0
+    assert counts["KCOS"] == len(store.read())
+    assert set(store.read()["icao"].tolist()) == {b"a00001"}
@@ -0,0 +1,89 @@
+import math
+
+import numpy as np
+import pytest
+
+from spatial import GridIndex, distance_nm
+from utils import AirportIndex, AirportNotFound, bounding_box
+
+
+def points(count=2000, seed=0):
+    """Random positions, clustered around an airport, the antimeridian and the north pole, with a few missing"""
+    rng = np.random.default_rng(seed)
+    lat = np.concatenate([rng.uniform(-89.9, 89.9, count), rng.normal(38.8, 1, count),
+                          rng.uniform(-5, 5, count), rng.uniform(85, 89.99, count)])
+    lon = np.concatenate([rng.uniform(-180, 180, count), rng.normal(-104.7, 1, count),
+                          rng.choice([-1, 1], count) * rng.uniform(178, 180, count), rng.uniform(-180, 180, count)])
+    lat[::97] = np.nan
+    return lat, lon
+
+
+queries = [(38.8, -104.7), (0, 179.9), (0, -180), (89.5, 10), (-60, 45), (45, -180 + 1e-9)]
+
+
+@pytest.mark.parametrize("cell", [0.5, 1.0, 5.0])
+@pytest.mark.parametrize("radius", [10, 60, 300])
+def test_within_matches_brute_force(cell, radius):
+    lat, lon = points()
+    grid = GridIndex(lat, lon, cell=cell)
+    assert len(grid) == np.isfinite(lat).sum()
+    for qlat, qlon in queries:
+        indices, distances = grid.within(qlat, qlon, radius)
+        brute = distance_nm(qlat, qlon, lat, lon)
+        assert sorted(indices.tolist()) == np.flatnonzero(brute <= radius).tolist()
+        assert np.allclose(distances, brute[indices])
+        assert (np.diff(distances) >= 0).all()
+
+
+def test_nearest_matches_brute_force():
+    lat, lon = points(300)
+    grid = GridIndex(lat, lon)
+    for qlat, qlon in queries + [(-89, 0)]:
+        index, distance = grid.nearest(qlat, qlon)
+        brute = distance_nm(qlat, qlon, lat, lon)
+        assert math.isclose(distance, np.nanmin(brute))
+        assert math.isclose(brute[index], distance)
+    assert grid.nearest(-45, 100, radius=1) == (None, math.inf)
+
+
+@pytest.mark.parametrize("radius", [25, 120])
+def test_pairs_match_brute_force(radius):
+    lat, lon = points(300)
+    grid = GridIndex(lat[:600], lon[:600], cell=1.0)
+    qlat, qlon = lat[600:], lon[600:]
+    queries, matched, distances = grid.pairs(qlat, qlon, radius)
+    found = set(zip(queries.tolist(), matched.tolist()))
+    assert len(found) == len(queries)
+    matrix = distance_nm(qlat[:, None], qlon[:, None], lat[None, :600], lon[None, :600])
+    assert found == set(zip(*[values.tolist() for values in np.nonzero(matrix <= radius)]))
+    assert np.allclose(distances, matrix[queries, matched])
+
+
+def test_airport_index(tmp_path):
+    filename = tmp_path / "airports.csv"
+    filename.write_text('"country_code","region_name","iata","icao","airport","latitude","longitude"\n'
+                        '"US","Colorado","COS","KCOS","City of Colorado Springs Municipal Airport","38.8058","-104.701"\n'
+                        '"US","Colorado","DEN","KDEN","Denver International Airport","39.8617","-104.673"\n'
+                        '"US","Colorado","APA","KAPA","Centennial Airport","39.5701","-104.849"\n'
+                        '"US","Colorado","","","Unnamed","39","-104"\n'
+                        '"US","Colorado","XXX","KXXX","Broken","n/a","-104"\n', encoding="utf-8")
+    index = AirportIndex.build(str(filename))
+    assert index.idents == ["KCOS", "KDEN", "KAPA"]
+    assert index.lookup(" kden ") == ["KDEN", 39.8617, -104.673]
+    with pytest.raises(AirportNotFound):
+        index.lookup("KXXX")
+    found = index.within(39.7, -104.8, 60)
+    assert [airport[0] for airport in found] == ["KAPA", "KDEN", "KCOS"][:len(found)]
+    brute = distance_nm(39.7, -104.8, index.lat, index.lon)
+    assert [airport[3] for airport in found] == pytest.approx(sorted(brute[brute <= 60]))
+
+
+def test_bounding_box():
+    lat_min, lat_max, lon_min, lon_max = bounding_box(38.8058, -104.701, 25)
+    assert math.isclose(lat_max - lat_min, 50 / 60)
+    # The box's edges are the radius away from its center
+    assert math.isclose(distance_nm(38.8058, -104.701, 38.8058, lon_max), 25)
+    assert bounding_box(0, 179.9, 25)[2:] == (-180, 180)
+    assert bounding_box(0, -179.9, 25)[2:] == (-180, 180)
+    assert bounding_box(89.9, 0, 25) == (89.9 - 25 / 60, 90, -180, 180)
+    assert bounding_box(-89.9, 0, 25)[:2] == (-90, -89.9 + 25 / 60)
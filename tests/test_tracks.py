@@ -0,0 +1,84 @@
+import numpy as np
+
+from classes import DotDict
+from scoring import snapshot_features
+from spatial import distance_nm
+from tracks import TrackStore
+
+
+def snapshot(now, hexes, lat, lon, alt, seen_pos=None, category="A5", gs=240.0):
+    count = len(hexes)
+    columns = dict(hex=np.array(hexes), lat=np.array(lat, float), lon=np.array(lon, float),
+                   alt_baro=np.array(alt, float), airground=np.zeros(count), gs=np.full(count, gs),
+                   baro_rate=np.full(count, -1000.0), track=np.full(count, 90.0),
+                   category=np.array([category] * count if isinstance(category, str) else category, dtype=object),
+                   seen_pos=np.zeros(count) if seen_pos is None else np.array(seen_pos, float))
+    return DotDict(now=now, columns=columns)
+
+
+def test_update_joins_by_hex():
+    store = TrackStore(depth=4)
+    result = store.update(snapshot(1000, ["c", "a", "b"], [41, 39, 40], [-90, -104, -100], [5000, 9000, 7000]))
+    assert (result.tracked, result.appeared, result.appended, result.evicted) == (3, 3, 3, 0)
+    # Reordered, with one aircraft that did not report a new position
+    result = store.update(snapshot(1005, ["b", "a", "c"], [40.1, 39.1, 41], [-100, -104, -90], [7000, 8750, 5000],
+                                   seen_pos=[0, 0, 5]))
+    assert (result.appeared, result.appended) == (0, 2)
+    assert store.lookup(["a", "zz", "c"])[1] == -1
+    assert store.history("a").lat.tolist() == [39, 39.1]
+    assert store.history("a").alt.tolist() == [9000, 8750]
+    assert store.history("c").time.tolist() == [1000]
+    assert store.history("zz") is None
+    assert "b" in store and "zz" not in store
+
+
+def test_ring_wraps_around():
+    store = TrackStore(depth=4)
+    for k in range(7):
+        store.update(snapshot(1000 + 5 * k, ["a"], [39 + 0.01 * k], [-104], [9000 - 100 * k]))
+    history = store.history("a")
+    assert np.allclose(history.lat, [39.03, 39.04, 39.05, 39.06])
+    assert history.time.tolist() == [1015, 1020, 1025, 1030]
+    window = store.window(store.lookup(["a"]), size=2)
+    assert np.allclose(window.lat, [[39.05, 39.06]])
+
+
+def test_eviction_reuses_rows():
+    store = TrackStore(depth=4, max_age=30, capacity=2)
+    store.update(snapshot(1000, ["a", "b"], [39, 40], [-104, -100], [9000, 7000]))
+    row = store.lookup(["b"])[0]
+    store.update(snapshot(1020, ["a"], [39.1], [-104], [9000]))
+    result = store.update(snapshot(1040, ["a"], [39.2], [-104], [9000]))
+    assert result.evicted == 1
+    assert "b" not in store and len(store) == 1
+    result = store.update(snapshot(1041, ["c"], [41], [-90], [5000]))
+    assert (result.appeared, result.evicted) == (1, 0)
+    assert store.lookup(["c"])[0] == row
+    assert store.history("c").lat.tolist() == [41]
+    # Growing past the capacity keeps the tracked aircraft
+    hexes = [f"{i:06x}" for i in range(100)]
+    store.update(snapshot(1042, hexes, np.linspace(30, 40, 100), np.full(100, -100), np.zeros(100)))
+    assert len(store) == 102
+    assert store.history("a").lat.tolist() == [39, 39.1, 39.2]
+
+
+def test_features_align_with_snapshot_features():
+    store = TrackStore(depth=8)
+    for k in range(6):
+        # e only appears in the last snapshot, c is not a monitored category
+        hexes = ["a", "b", "c", "d"] + (["e"] if k == 5 else [])
+        snap = snapshot(1000 + 5 * k, hexes, [39, 40, 41, 38, 37][:len(hexes)],
+                        [-104 + 0.05 * k, -100, -90 + 0.05 * k, -95, -96][:len(hexes)],
+                        [9000 - 250 * k, 5000, 5000, 3000, 2000][:len(hexes)],
+                        category=["A5", "A5", "A1", "A3", "A4"][:len(hexes)])
+        store.update(snap)
+    features = snapshot_features(snap)
+    assert features.hex.tolist() == ["a", "b", "d", "e"]
+    tracked = store.features(features.hex)
+    assert len(tracked.grad) == len(tracked.deviation) == len(features.hex)
+    assert tracked.points.tolist() == [6, 6, 6, 1]
+    # Parked aircraft and aircraft with a single position have no features
+    assert np.isnan(tracked.grad[1:]).all()
+    flown = distance_nm(39, -104, 39, -104 + 0.25)
+    assert np.isclose(tracked.grad[0], -1250 / flown, rtol=1e-3)
+    assert np.isclose(tracked.deviation[0], 0, atol=1e-3)